@@ -11,6 +11,7 @@ VERSIÓN CORREGIDA: Sin focus_areas, con rate limiting, sin línea x basura
 """
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
@@ -196,58 +197,68 @@ class SupervisorAgent:
         self.last_api_call = time.time()
         self.api_calls_count += 1
     
-    def orchestrate_research(self, task: str, context: str = "") -> List[Fragment]:
+    def orchestrate_research(self, task: str, context: str = "",
+                             parallel: bool = False) -> List[Fragment]:
         """
         Coordina la investigación de todo el equipo de agentes.
-        
+
         Método principal que orquesta el proceso de investigación, distribuyendo
         tareas especializadas a cada agente, recolectando sus hallazgos, y
         seleccionando los mejores fragmentos para formar la base de evidencia
         del equipo.
-        
+
         Args:
             task (str): Tarea principal de investigación.
             context (str, optional): Contexto adicional del debate.
-            
+            parallel (bool, optional): Si es True, los agentes investigan
+                concurrentemente en hilos. La carga es I/O-bound (round-trips
+                a LLMs y búsquedas), así que el tiempo de la fase pasa de
+                la suma de latencias por agente a aproximadamente el máximo.
+                A cambio se omiten las pausas progresivas anti rate-limiting
+                del modo secuencial; úsalo solo con cuotas de API holgadas.
+
         Returns:
             List[Fragment]: Lista consolidada de los mejores fragmentos seleccionados.
         """
         logger.info(f"🎬 {self.supervisor_id} coordinando investigación de equipo")
         logger.info(f"📋 Tarea: {task}")
-        
+
         self.debate_context = context
         all_fragments = []
-        
-        # Coordinar cada agente según su especialidad
-        for i, agent in enumerate(self.agents):
-            logger.info(f"🤖 Coordinando agente {agent.role.value}...")
-            
-            try:
-                # Pausa progresiva entre agentes para evitar rate limiting
-                if i > 0:
-                    pause_time = 3 + i  # 4s, 5s, 6s, 7s, 8s
-                    logger.info(f"⏳ Pausa de {pause_time}s antes del siguiente agente...")
-                    time.sleep(pause_time)
-                
-                # Personalizar la tarea según la especialidad del agente
-                specialized_task = self._customize_task_for_agent(task, agent)
-                
-                # Investigación del agente
-                agent_fragments = agent.research(specialized_task, context)
-                
-                # Agregar metadata del supervisor a los fragmentos
-                for fragment in agent_fragments:
-                    fragment.supervisor_team = self.team
-                    fragment.supervisor_position = self.position
-                
-                all_fragments.extend(agent_fragments)
-                
-                logger.info(f"✅ Agente {agent.role.value}: {len(agent_fragments)} fragmentos")
-                
-            except Exception as e:
-                logger.error(f"❌ Error con agente {agent.role.value}: {e}")
-                continue
-        
+
+        if parallel:
+            all_fragments = self._research_team_parallel(task, context)
+        else:
+            # Coordinar cada agente según su especialidad (modo secuencial)
+            for i, agent in enumerate(self.agents):
+                logger.info(f"🤖 Coordinando agente {agent.role.value}...")
+
+                try:
+                    # Pausa progresiva entre agentes para evitar rate limiting
+                    if i > 0:
+                        pause_time = 3 + i  # 4s, 5s, 6s, 7s, 8s
+                        logger.info(f"⏳ Pausa de {pause_time}s antes del siguiente agente...")
+                        time.sleep(pause_time)
+
+                    # Personalizar la tarea según la especialidad del agente
+                    specialized_task = self._customize_task_for_agent(task, agent)
+
+                    # Investigación del agente
+                    agent_fragments = agent.research(specialized_task, context)
+
+                    # Agregar metadata del supervisor a los fragmentos
+                    for fragment in agent_fragments:
+                        fragment.supervisor_team = self.team
+                        fragment.supervisor_position = self.position
+
+                    all_fragments.extend(agent_fragments)
+
+                    logger.info(f"✅ Agente {agent.role.value}: {len(agent_fragments)} fragmentos")
+
+                except Exception as e:
+                    logger.error(f"❌ Error con agente {agent.role.value}: {e}")
+                    continue
+
         # Consolidar y seleccionar los mejores fragmentos
         best_fragments = self._select_best_fragments(all_fragments, task)
         
@@ -256,7 +267,50 @@ class SupervisorAgent:
         
         logger.info(f"🎯 Investigación completada: {len(best_fragments)} fragmentos seleccionados")
         return best_fragments
-    
+
+    def _research_team_parallel(self, task: str, context: str) -> List[Fragment]:
+        """
+        Ejecuta la investigación de todos los agentes concurrentemente.
+
+        Fan-out en hilos de las llamadas agent.research (I/O-bound): el
+        tiempo de la fase se reduce de la suma de latencias a
+        aproximadamente la del agente más lento. Los resultados se
+        recolectan en el orden original de los agentes para mantener
+        salida determinista.
+
+        Args:
+            task (str): Tarea principal de investigación.
+            context (str): Contexto adicional del debate.
+
+        Returns:
+            List[Fragment]: Fragmentos de todos los agentes, con metadata
+                del supervisor ya aplicada.
+        """
+        def _research_one(agent: SlaveAgent) -> List[Fragment]:
+            specialized_task = self._customize_task_for_agent(task, agent)
+            return agent.research(specialized_task, context)
+
+        all_fragments: List[Fragment] = []
+        with ThreadPoolExecutor(max_workers=len(self.agents)) as executor:
+            futures = [(agent, executor.submit(_research_one, agent))
+                       for agent in self.agents]
+            for agent, future in futures:
+                try:
+                    agent_fragments = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Error con agente {agent.role.value}: {e}")
+                    continue
+
+                # Agregar metadata del supervisor a los fragmentos
+                for fragment in agent_fragments:
+                    fragment.supervisor_team = self.team
+                    fragment.supervisor_position = self.position
+
+                all_fragments.extend(agent_fragments)
+                logger.info(f"✅ Agente {agent.role.value}: {len(agent_fragments)} fragmentos")
+
+        return all_fragments
+
     def _customize_task_for_agent(self, base_task: str, agent: SlaveAgent) -> str:
         """
         Personaliza la tarea según la especialidad del agente.
@@ -13,10 +13,11 @@ con flujos condicionales para determinar cuándo continuar con nuevas rondas o f
 VERSIÓN CORREGIDA: Sin objetos en estado, sin focus_areas, con rate limiting
 """
 import logging
-from typing import Dict, List, Any, Optional, TypedDict, Annotated
+from typing import Callable, Dict, List, Any, Optional, TypedDict, Annotated
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
 
 # LangGraph imports
 from langgraph.graph import StateGraph, END
@@ -93,6 +94,8 @@ class DebateConfig:
     contra_position: str       # Posición que defenderá el equipo CONTRA
     max_rounds: int = 3        # Número máximo de rondas de debate
     timeout_minutes: int = 10  # Tiempo máximo para completar el debate
+    parallel_agents: bool = False  # Investigar con los agentes de cada equipo en paralelo
+    parallel_teams: bool = False   # Ejecutar la investigación PRO y CONTRA concurrentemente
     # focus_areas: List[str] = None  # ❌ ELIMINADO - redundante con roles
 
 class DebateOrchestrator:
@@ -133,7 +136,14 @@ class DebateOrchestrator:
         # para evitar problemas de serialización
         self.supervisor_pro = None
         self.supervisor_contra = None
-        
+
+        # Modos de investigación en paralelo (se configuran desde DebateConfig)
+        self._parallel_agents = False
+        self._parallel_teams = False
+
+        # Callback opcional para emitir eventos de progreso a la UI
+        self._on_event: Optional[Callable[[Dict[str, Any]], None]] = None
+
         # Construir el grafo de flujo
         self._build_graph()
         
@@ -157,10 +167,10 @@ class DebateOrchestrator:
         # Nodo de inicio - configura el debate
         builder.add_node("setup_debate", self._setup_debate_node)
         
-        # Nodos de investigación inicial
-        builder.add_node("research_pro", self._research_pro_node)
-        builder.add_node("research_contra", self._research_contra_node)
-        
+        # Nodo de investigación inicial (ambos equipos; secuencial o en
+        # paralelo según configuración)
+        builder.add_node("research_teams", self._research_teams_node)
+
         # Nodos de argumentación
         builder.add_node("pro_argument", self._pro_argument_node)
         builder.add_node("contra_argument", self._contra_argument_node)
@@ -176,12 +186,11 @@ class DebateOrchestrator:
         # Punto de entrada
         builder.set_entry_point("setup_debate")
         
-        # Desde setup, ir a investigación secuencial (evitar concurrencia)
-        builder.add_edge("setup_debate", "research_pro")
-        builder.add_edge("research_pro", "research_contra")
-        
+        # Desde setup, a la fase de investigación de ambos equipos
+        builder.add_edge("setup_debate", "research_teams")
+
         # Desde investigación, al primer argumento PRO
-        builder.add_edge("research_contra", "pro_argument")
+        builder.add_edge("research_teams", "pro_argument")
         
         # Flujo de argumentación: PRO → CONTRA → evaluación
         builder.add_edge("pro_argument", "contra_argument")
@@ -204,7 +213,29 @@ class DebateOrchestrator:
         self.graph = builder.compile(checkpointer=self.memory)
         
         logger.info("🏗️ Grafo de debate construido con éxito")
-    
+
+    def _emit_event(self, event_type: str, **payload: Any) -> None:
+        """
+        Emite un evento de progreso al callback registrado, si existe.
+
+        Los eventos permiten a consumidores externos (p. ej. la interfaz
+        web) reaccionar a hitos del debate mientras el grafo sigue en
+        ejecución, en lugar de esperar al estado final. Un fallo del
+        callback nunca debe interrumpir el debate, por lo que se captura
+        y registra cualquier excepción.
+
+        Args:
+            event_type: Tipo de evento (p. ej. "research_completed",
+                "argument_added").
+            **payload: Datos adicionales del evento.
+        """
+        if self._on_event is None:
+            return
+        try:
+            self._on_event({"type": event_type, **payload})
+        except Exception as e:
+            logger.warning(f"⚠️ Error en callback de eventos: {e}")
+
     def _setup_debate_node(self, state: DebateState) -> DebateState:
         """
         Nodo inicial: configura supervisores y estado del debate.
@@ -291,7 +322,8 @@ class DebateOrchestrator:
             # Coordinar investigación del equipo PRO
             fragments = self.supervisor_pro.orchestrate_research(
                 task=research_task,
-                context=f"Debate sobre: {state['topic']}"
+                context=f"Debate sobre: {state['topic']}",
+                parallel=self._parallel_agents
             )
             
             # Convertir fragmentos a diccionarios para almacenarlos en el estado
@@ -302,7 +334,8 @@ class DebateOrchestrator:
             state["current_time"] = datetime.now().isoformat()
             
             logger.info(f"✅ Investigación PRO completada: {len(fragments)} fragmentos")
-            
+            self._emit_event("research_completed", team="pro", fragments=len(fragments))
+
         except Exception as e:
             logger.error(f"❌ Error en research_pro: {e}")
             state["errors"].append(f"Research PRO error: {str(e)}")
@@ -340,7 +373,8 @@ class DebateOrchestrator:
             # Coordinar investigación del equipo CONTRA
             fragments = self.supervisor_contra.orchestrate_research(
                 task=research_task,
-                context=f"Debate sobre: {state['topic']}"
+                context=f"Debate sobre: {state['topic']}",
+                parallel=self._parallel_agents
             )
             
             # Convertir fragmentos a diccionarios para almacenarlos en el estado
@@ -351,12 +385,48 @@ class DebateOrchestrator:
             state["current_time"] = datetime.now().isoformat()
             
             logger.info(f"✅ Investigación CONTRA completada: {len(fragments)} fragmentos")
-            
+            self._emit_event("research_completed", team="contra", fragments=len(fragments))
+
         except Exception as e:
             logger.error(f"❌ Error en research_contra: {e}")
             state["errors"].append(f"Research CONTRA error: {str(e)}")
             state["contra_fragments"] = []  # Garantizar que existe la lista aunque sea vacía
-        
+
+        return state
+
+    def _research_teams_node(self, state: DebateState) -> DebateState:
+        """
+        Nodo combinado de investigación de ambos equipos.
+
+        Las investigaciones PRO y CONTRA no tienen dependencia de datos
+        entre sí (escriben claves distintas del estado), por lo que
+        pueden ejecutarse como fan-out task-parallel. Con
+        parallel_teams activo se lanzan en un ThreadPoolExecutor de dos
+        workers y la fase dura lo que el equipo más lento; en caso
+        contrario se mantiene la ejecución secuencial original
+        (PRO → CONTRA) con sus pausas anti rate-limit.
+
+        Args:
+            state: Estado actual del debate.
+
+        Returns:
+            Estado actualizado con los fragmentos de ambos equipos.
+        """
+        if not self._parallel_teams:
+            # Flujo secuencial original
+            state = self._research_pro_node(state)
+            state = self._research_contra_node(state)
+            return state
+
+        logger.info("🔍 Investigación PRO y CONTRA en paralelo")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Cada nodo muta claves disjuntas del mismo estado y maneja
+            # sus propios errores, por lo que el fan-out es seguro
+            future_pro = executor.submit(self._research_pro_node, state)
+            future_contra = executor.submit(self._research_contra_node, state)
+            future_pro.result()
+            future_contra.result()
+
         return state
     
     def _pro_argument_node(self, state: DebateState) -> DebateState:
@@ -424,7 +494,14 @@ class DebateOrchestrator:
             }
             state["pro_arguments"].append(fallback_arg)
             state["last_pro_argument"] = fallback_arg["content"]
-        
+
+        self._emit_event(
+            "argument_added",
+            team="pro",
+            round=state["current_round"],
+            total_arguments=len(state["pro_arguments"]) + len(state["contra_arguments"])
+        )
+
         return state
     
     def _contra_argument_node(self, state: DebateState) -> DebateState:
@@ -485,7 +562,14 @@ class DebateOrchestrator:
             }
             state["contra_arguments"].append(fallback_arg)
             state["last_contra_argument"] = fallback_arg["content"]
-        
+
+        self._emit_event(
+            "argument_added",
+            team="contra",
+            round=state["current_round"],
+            total_arguments=len(state["pro_arguments"]) + len(state["contra_arguments"])
+        )
+
         return state
     
     def _evaluate_round_node(self, state: DebateState) -> DebateState:
@@ -728,21 +812,31 @@ DURACIÓN:
         
         return summary.strip()
     
-    def run_debate(self, config: DebateConfig) -> Dict[str, Any]:
+    def run_debate(self, config: DebateConfig,
+                   on_event: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Ejecuta un debate completo usando el grafo definido.
-        
+
         Método principal para iniciar y ejecutar un debate completo,
         desde la configuración inicial hasta la determinación del ganador.
-        
+
         Args:
             config: Configuración del debate a ejecutar.
-            
+            on_event: Callback opcional que recibe eventos de progreso
+                (diccionarios con clave "type") a medida que los nodos
+                del grafo completan hitos. Permite a la UI actualizarse
+                sin bloquear hasta el estado final.
+
         Returns:
             Estado final del debate con todos los resultados.
         """
         logger.info(f"🎯 Iniciando debate: {config.topic}")
-        
+
+        # Propagar los modos de investigación y el callback de progreso
+        self._parallel_agents = config.parallel_agents
+        self._parallel_teams = config.parallel_teams
+        self._on_event = on_event
+
         # Crear estado inicial sin objetos complejos
         initial_state = DebateState(
             topic=config.topic,
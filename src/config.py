@@ -8,6 +8,7 @@ Singleton para la carga de variables de entorno y utiliza métodos de clase para
 acceder a los valores de configuración de manera eficiente.
 """
 import os
+import functools
 from enum import Enum
 from typing import Dict, List, Any
 from dotenv import load_dotenv
@@ -30,7 +31,14 @@ class Config:
     
     # Flag para indicar si las variables de entorno ya fueron cargadas
     _loaded = False
-    
+
+    # Cache de valores derivados del entorno - Memoization Pattern
+    # Los accesores dinámicos re-parsean os.getenv en cada llamada aunque
+    # el entorno no cambia durante la vida del proceso; el cache reduce
+    # cada acceso repetido a una búsqueda de diccionario
+    _cache: Dict[str, Any] = {}
+
+
     @classmethod
     def _ensure_loaded(cls):
         """
@@ -38,10 +46,15 @@ class Config:
         
         Implementa un patrón lazy-loading para cargar las variables
         de entorno solo cuando son necesarias y una única vez.
+
+        El retorno temprano mantiene el camino común (ya cargado) en una
+        sola lectura de atributo, sin tocar el filesystem: load_dotenv
+        hace stat/lectura del .env y solo debe pagarse la primera vez.
         """
-        if not cls._loaded:
-            load_dotenv()
-            cls._loaded = True
+        if cls._loaded:
+            return
+        load_dotenv()
+        cls._loaded = True
     
     # Métodos de configuración dinámica desde variables de entorno
     @classmethod
@@ -53,7 +66,9 @@ class Config:
             int: Número máximo de rondas, por defecto 3 si no está configurado.
         """
         cls._ensure_loaded()
-        return int(os.getenv("MAX_ROUNDS", "3"))
+        if "MAX_ROUNDS" not in cls._cache:
+            cls._cache["MAX_ROUNDS"] = int(os.getenv("MAX_ROUNDS", "3"))
+        return cls._cache["MAX_ROUNDS"]
     
     @classmethod
     def AGENTS_PER_TEAM(cls) -> int:
@@ -64,7 +79,9 @@ class Config:
             int: Número de agentes por equipo, por defecto 5 si no está configurado.
         """
         cls._ensure_loaded()
-        return int(os.getenv("AGENTS_PER_TEAM", "5"))
+        if "AGENTS_PER_TEAM" not in cls._cache:
+            cls._cache["AGENTS_PER_TEAM"] = int(os.getenv("AGENTS_PER_TEAM", "5"))
+        return cls._cache["AGENTS_PER_TEAM"]
     
     @classmethod
     def DEBUG_MODE(cls) -> bool:
@@ -75,7 +92,9 @@ class Config:
             bool: True si está en modo debug, False en caso contrario.
         """
         cls._ensure_loaded()
-        return os.getenv("DEBUG_MODE", "True").lower() == "true"
+        if "DEBUG_MODE" not in cls._cache:
+            cls._cache["DEBUG_MODE"] = os.getenv("DEBUG_MODE", "True").lower() == "true"
+        return cls._cache["DEBUG_MODE"]
     
     # Constantes de tiempos de espera para operaciones
     SEARCH_TIMEOUT = 30  # segundos máximos para operaciones de búsqueda
@@ -105,10 +124,27 @@ class Config:
         
         Puede ser llamado explícitamente para garantizar que
         las variables de entorno estén cargadas antes de usar
-        la configuración.
+        la configuración. Para forzar una recarga (p.ej. en tests),
+        usar Config.reload().
         """
+        if cls._loaded:
+            return
         cls._ensure_loaded()
-    
+
+    @classmethod
+    def reload(cls):
+        """
+        Invalida el cache de configuración y fuerza una recarga.
+
+        Limpia los valores memoizados y el flag de carga para que la
+        próxima lectura vuelva a consultar las variables de entorno.
+        Pensado para tests y para procesos de larga vida donde el
+        entorno pueda cambiar explícitamente.
+        """
+        cls._cache.clear()
+        cls._environment_config_for.cache_clear()
+        cls._loaded = False
+
     @classmethod
     def get_environment_config(cls) -> Dict[str, Any]:
         """
@@ -121,8 +157,26 @@ class Config:
             Dict[str, Any]: Diccionario con la configuración específica del ambiente.
         """
         cls._ensure_loaded()
+        # El cache está keyed por la única variable de entorno consultada:
+        # entorno estable -> hit directo; cambio de ENVIRONMENT -> recompute
         env = os.getenv("ENVIRONMENT", "development")
-        
+        return cls._environment_config_for(env)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _environment_config_for(env: str) -> Dict[str, Any]:
+        """
+        Calcula la configuración para un ambiente concreto (memoizado).
+
+        Separado de get_environment_config para que la memoización use
+        el valor de ENVIRONMENT como clave explícita del cache.
+
+        Args:
+            env (str): Nombre del ambiente de ejecución.
+
+        Returns:
+            Dict[str, Any]: Configuración del ambiente solicitado.
+        """
         configs = {
             "production": {
                 "max_rounds": 5,
@@ -52,7 +52,17 @@ Dependencies: src.config, src.utils, logging, datetime
 
 import sys
 import os
-from typing import List, Dict, Any, Tuple, Optional, Union
+import io
+import re
+import time
+import queue
+import argparse
+import functools
+import threading
+import importlib.util
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, List, Dict, Any, TextIO, Tuple, Optional, Union
 from datetime import datetime
 import logging
 
@@ -62,11 +72,123 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Importaciones del sistema - Layered Architecture
 # Cada importación representa una capa específica del sistema
-from src.config import Config, ConfigValidator, LogConfig
-from src.utils.github_models import github_models
+from src.config import Config, ConfigValidator, LogConfig, AgentRole
+from src.utils.github_models import (
+    github_models,
+    get_supervisor_pro_model,
+    get_supervisor_contra_model,
+    get_agent_model,
+)
 from src.utils.search import SearchSystem
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_validation_report() -> Dict[str, List[str]]:
+    """
+    Memoiza el reporte de validación de configuración.
+
+    El reporte se deriva exclusivamente de variables de entorno, que no
+    cambian durante la vida del proceso, por lo que re-calcularlo en cada
+    ejecución del validador es trabajo redundante. Aplica el patrón
+    "read once, memoize" para configuración estática.
+
+    Returns:
+        Dict[str, List[str]]: Reporte de validación de ConfigValidator.
+
+    Note:
+        Usar SystemValidator.refresh() (o cache_clear() directamente en
+        tests) para invalidar el cache si el entorno cambia.
+    """
+    return ConfigValidator.get_validation_report()
+
+
+# Cache de salud de servicios externos con TTL - Health Check Cache
+# Evita re-sondear un endpoint conocido como caído en validaciones
+# consecutivas (cada sondeo es un round-trip HTTPS completo)
+_HEALTH_TTL_SECONDS = 30.0
+_health_cache: Dict[str, Tuple[float, bool]] = {}
+
+# Presupuesto de tiempo por sondeo externo - Timeout Pattern
+# Un endpoint colgado no debe bloquear el validador completo (p.ej. en CI)
+MODEL_PROBE_TIMEOUT = 10   # segundos para sondeos de modelos LLM
+SEARCH_PROBE_TIMEOUT = 15  # segundos para búsquedas de prueba
+
+# Predicado precompilado para la respuesta esperada de los sondeos.
+# Evita crear una copia en mayúsculas de la respuesta completa del LLM
+# en cada check; el límite de palabra evita falsos positivos ("BOOK")
+_OK_RE = re.compile(r"\bOK\b", re.IGNORECASE)
+
+# Plantilla estática del bloque de información del sistema.
+# Las etiquetas constantes se construyen una sola vez en tiempo de
+# importación; get_system_info solo rellena los valores dinámicos
+_SYS_INFO_TEMPLATE = (
+    "🔧 Configuración actual:\n"
+    "   - MAX_ROUNDS: {max_rounds}\n"                          # Límite de rondas de debate
+    "   - AGENTS_PER_TEAM: {agents_per_team}\n"                # Agentes por equipo
+    "   - MAX_FRAGMENTS_PER_AGENT: {max_fragments}\n"          # Límite de evidencia
+    "   - MAX_QUERIES_PER_AGENT: {max_queries}\n"              # Límite de búsquedas
+    "   - MIN_FRAGMENT_SCORE: {min_fragment_score}\n"          # Umbral de calidad
+    "   - DEBUG_MODE: {debug_mode}"                            # Estado de debug
+)
+
+
+def _cached_health(service: str, probe: Callable[[], bool],
+                   ttl: float = _HEALTH_TTL_SECONDS) -> bool:
+    """
+    Devuelve el estado de salud de un servicio externo con cache TTL.
+
+    Consulta el cache antes de ejecutar el sondeo real; si el resultado
+    tiene menos de `ttl` segundos de antigüedad se reutiliza. Espejo del
+    patrón de Health Checker consultado antes de enrutar peticiones.
+
+    Args:
+        service (str): Clave identificadora del servicio
+        probe (Callable[[], bool]): Sondeo real de conectividad
+        ttl (float): Segundos de validez del resultado cacheado
+
+    Returns:
+        bool: True si el servicio está disponible
+    """
+    now = time.monotonic()
+    cached = _health_cache.get(service)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    status = bool(probe())
+    _health_cache[service] = (time.monotonic(), status)
+    return status
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationResult:
+    """
+    Resultado estructurado de una validación completa del sistema.
+
+    Value Object inmutable que separa el cómputo de la validación de su
+    renderizado: consumidores embebidos pueden leer `success` y descartar
+    la guía textual sin pagar ningún trabajo de I/O.
+
+    Attributes:
+        success (bool): True si el sistema está listo para debates
+        next_steps (Tuple[str, ...]): Guía de próximos pasos para el usuario
+    """
+    success: bool
+    next_steps: Tuple[str, ...]
+
+
+def render_cli(result: ValidationResult) -> None:
+    """
+    Renderiza la guía de próximos pasos de un resultado de validación.
+
+    Capa fina de presentación separada del cómputo: toda la salida se
+    emite en una única escritura.
+
+    Args:
+        result (ValidationResult): Resultado estructurado a renderizar
+    """
+    sys.stdout.write("\n" + "\n".join(result.next_steps) + "\n")
+    sys.stdout.flush()
+
+
 class SystemValidator:
     """
     Validador integral del sistema de debates con arquitectura modular.
@@ -77,9 +199,9 @@ class SystemValidator:
     estructurada y escalable.
     
     Attributes:
-        errors (List[str]): Colección de errores críticos encontrados
-        warnings (List[str]): Colección de advertencias no críticas
-        successes (List[str]): Colección de validaciones exitosas
+        errors (Deque[str]): Colección de errores críticos encontrados
+        warnings (Deque[str]): Colección de advertencias no críticas
+        successes (Deque[str]): Colección de validaciones exitosas
         
     Design Patterns:
         - Health Check: Verificación sistemática de componentes
@@ -99,29 +221,161 @@ class SystemValidator:
         - Usability: Mensajes claros y soluciones sugeridas
         - Performance: Validación eficiente y rápida
     """
-    
-    def __init__(self) -> None:
+
+    # Cache de símbolos del dominio tras la primera importación exitosa.
+    # Ejecutar el validador varias veces en el mismo proceso reutiliza
+    # los módulos en lugar de re-ejercitar el sistema de imports
+    _domain_modules: Optional[Tuple[Any, ...]] = None
+
+    # Memoización del sistema de búsqueda - Lazy Initialization
+    # La instancia re-lee variables de entorno al construirse y
+    # get_status() re-sondea la configuración; ambas cosas son estables
+    # entre ejecuciones consecutivas del validador
+    _search_system: Optional[SearchSystem] = None
+    _search_status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+    _SEARCH_STATUS_TTL = 10.0  # segundos de validez del status cacheado
+
+    def __init__(self, out: Optional[TextIO] = None) -> None:
         """
         Inicializa el validador con colectores vacíos para resultados.
-        
+
         Implementa el patrón Constructor con inicialización de estado limpio,
         siguiendo el principio de Separation of Concerns donde cada instancia
         mantiene su propio estado de validación.
-        
+
+        Args:
+            out (Optional[TextIO]): Destino de la salida del validador;
+                por defecto sys.stdout. Inyectable para tests o para
+                redirigir el reporte completo a un archivo/buffer.
+
         Postconditions:
-            - self.errors está inicializado como lista vacía
-            - self.warnings está inicializado como lista vacía  
-            - self.successes está inicializado como lista vacía
-            
+            - self.errors está inicializado como deque vacío
+            - self.warnings está inicializado como deque vacío
+            - self.successes está inicializado como deque vacío
+
         Complexity:
             Tiempo: O(1) - Inicialización constante
-            Espacio: O(1) - Almacenamiento de tres listas vacías
+            Espacio: O(1) - Almacenamiento de tres colectores vacíos
         """
         # Inicialización de colectores - Collector Pattern
-        self.errors: List[str] = []      # Errores críticos que impiden ejecución
-        self.warnings: List[str] = []    # Advertencias que afectan rendimiento
-        self.successes: List[str] = []   # Validaciones exitosas para confirmación
-        
+        # deque en lugar de list: append es O(1) y thread-safe por
+        # contrato (no solo por el GIL), lo que permite agregar resultados
+        # desde validaciones concurrentes sin sincronización extra
+        self.errors: Deque[str] = deque()      # Errores críticos que impiden ejecución
+        self.warnings: Deque[str] = deque()    # Advertencias que afectan rendimiento
+        self.successes: Deque[str] = deque()   # Validaciones exitosas para confirmación
+
+        # Buffer de salida - Batched I/O Pattern
+        # Acumula el output de cada sección y lo vuelca en una sola
+        # escritura, evitando un syscall (y un lock de stdout) por línea
+        self._buf: io.StringIO = io.StringIO()
+
+        # Destino de salida inyectable - Dependency Injection
+        self._out: TextIO = out if out is not None else sys.stdout
+
+    def _emit(self, text: str = "") -> None:
+        """
+        Escribe una línea en el buffer interno de salida.
+
+        Sustituto de print(): acumula en memoria en lugar de escribir
+        directamente a stdout, para que cada sección se vuelque de forma
+        atómica con una única llamada de escritura.
+
+        Args:
+            text (str): Línea a escribir (sin newline final)
+        """
+        self._buf.write(text + "\n")
+
+    def _flush(self) -> None:
+        """
+        Vuelca el buffer acumulado a stdout en una sola escritura.
+
+        Reduce ~50 syscalls por ejecución a una por sección y garantiza
+        output atómico (sin interleaving) si en el futuro las validaciones
+        se ejecutan concurrentemente.
+
+        Side Effects:
+            Escribe en el destino configurado y reinicia el buffer interno
+        """
+        self._out.write(self._buf.getvalue())
+        self._out.flush()
+        self._buf = io.StringIO()
+
+    def _get_report(self) -> Dict[str, List[str]]:
+        """
+        Punto de acceso único al reporte de validación de configuración.
+
+        Centraliza la obtención del reporte memoizado para que todas las
+        validaciones que necesiten datos de configuración compartan el
+        mismo dict sin re-invocar a ConfigValidator.
+
+        Returns:
+            Dict[str, List[str]]: Reporte de validación cacheado
+        """
+        return _cached_validation_report()
+
+    def _run_with_timeout(self, label: str, func: Callable[[], Any],
+                          timeout: float) -> Any:
+        """
+        Ejecuta un sondeo externo con presupuesto de tiempo fijo.
+
+        Lanza la llamada en un hilo daemon y espera como máximo
+        `timeout` segundos, de modo que un endpoint colgado no pueda
+        bloquear indefinidamente el validador. El hilo es daemon a
+        propósito: concurrent.futures re-une todos sus workers al cierre
+        del intérprete, así que un ThreadPoolExecutor abandonado tras el
+        timeout mantendría el proceso vivo hasta que el sondeo colgado
+        terminara; un daemon thread se descarta sin bloquear la salida.
+
+        Args:
+            label (str): Nombre descriptivo del sondeo (para el error)
+            func (Callable[[], Any]): Llamada a ejecutar
+            timeout (float): Segundos máximos de espera
+
+        Returns:
+            Any: Resultado de la llamada
+
+        Raises:
+            TimeoutError: Si el sondeo excede el presupuesto de tiempo
+        """
+        results: "queue.Queue[Tuple[bool, Any]]" = queue.Queue(maxsize=1)
+
+        def _probe() -> None:
+            try:
+                results.put((True, func()))
+            except Exception as exc:
+                results.put((False, exc))
+
+        worker = threading.Thread(target=_probe, daemon=True,
+                                  name=f"probe-{label}")
+        worker.start()
+        try:
+            ok, payload = results.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"{label} excedió el límite de {timeout}s")
+        if not ok:
+            raise payload
+        return payload
+
+    @staticmethod
+    def refresh() -> None:
+        """
+        Invalida los caches de validación para forzar una re-lectura.
+
+        Útil cuando el entorno cambió durante la vida del proceso (por
+        ejemplo, tras corregir un .env) o entre ejecuciones repetidas en
+        tests. Espejo del patrón clearCache() de caches de entorno.
+
+        Side Effects:
+            Limpia el cache de _cached_validation_report, el cache de
+            salud de servicios externos y la memoización del sistema
+            de búsqueda
+        """
+        _cached_validation_report.cache_clear()
+        _health_cache.clear()
+        SystemValidator._search_system = None
+        SystemValidator._search_status_cache = None
+
     def print_header(self, title: str) -> None:
         """
         Renderiza un header visual para secciones de validación.
@@ -141,9 +395,9 @@ class SystemValidator:
         Side Effects:
             Imprime contenido formateado en stdout
         """
-        print("\n" + "="*60)  # Separador superior con longitud fija
-        print(f"🔍 {title}")   # Título con emoji para identificación visual
-        print("="*60)         # Separador inferior matching
+        self._emit("\n" + "="*60)  # Separador superior con longitud fija
+        self._emit(f"🔍 {title}")   # Título con emoji para identificación visual
+        self._emit("="*60)         # Separador inferior matching
 
     def print_section(self, title: str) -> None:
         """
@@ -163,7 +417,7 @@ class SystemValidator:
         Side Effects:
             Imprime contenido formateado en stdout
         """
-        print(f"\n{'='*20} {title} {'='*20}")
+        self._emit(f"\n{'='*20} {title} {'='*20}")
 
     def validate_environment(self) -> None:
         """
@@ -196,31 +450,34 @@ class SystemValidator:
         """
         self.print_section("VARIABLES DE ENTORNO")
         
-        # Delegación a ConfigValidator - Delegation Pattern
-        validation_report = ConfigValidator.get_validation_report()
+        # Delegación a ConfigValidator con memoización - Delegation Pattern
+        validation_report = self._get_report()
         
         # Procesamiento de errores de entorno - Error Handling
         env_errors = validation_report["environment_errors"]
         if env_errors:
-            print("❌ ERRORES EN CONFIGURACIÓN:")
+            self._emit("❌ ERRORES EN CONFIGURACIÓN:")
             for error in env_errors:
-                print(f"   - {error}")
+                self._emit(f"   - {error}")
                 self.errors.append(f"Environment: {error}")
         else:
-            print("✅ Todas las variables de entorno están configuradas")
+            self._emit("✅ Todas las variables de entorno están configuradas")
             self.successes.append("Variables de entorno configuradas")
         
         # Procesamiento de advertencias de límites - Warning Handling
         limits_warnings = validation_report["limits_warnings"]
         if limits_warnings:
-            print("\n⚠️ ADVERTENCIAS DE LÍMITES:")
+            self._emit("\n⚠️ ADVERTENCIAS DE LÍMITES:")
             for warning in limits_warnings:
-                print(f"   - {warning}")
+                self._emit(f"   - {warning}")
                 self.warnings.append(f"Limits: {warning}")
         else:
-            print("✅ Límites de configuración son razonables")
+            self._emit("✅ Límites de configuración son razonables")
             self.successes.append("Límites apropiados")
 
+        # Volcado atómico de la sección - Batched I/O
+        self._flush()
+
     def validate_models(self) -> None:
         """
         Valida la conectividad y funcionalidad de modelos de lenguaje.
@@ -259,68 +516,89 @@ class SystemValidator:
         self.print_section("MODELOS LLM")
         
         try:
-            # Test de conectividad general - Circuit Breaker Pattern
-            if github_models.test_connection():
-                print("✅ Conexión con GitHub Models exitosa")
+            # Test de conectividad general con cache TTL - Circuit Breaker
+            # Si el endpoint se sondeó hace <30s se reutiliza el resultado;
+            # con estado False se omiten también los tres probes por modelo
+            if _cached_health(
+                "github_models",
+                lambda: self._run_with_timeout(
+                    "Conexión GitHub Models",
+                    github_models.test_connection,
+                    MODEL_PROBE_TIMEOUT,
+                ),
+            ):
+                self._emit("✅ Conexión con GitHub Models exitosa")
                 self.successes.append("GitHub Models conectado")
-                
-                # Importación de factory functions - Factory Pattern
-                from src.utils.github_models import get_supervisor_pro_model, get_supervisor_contra_model, get_agent_model
-                
+
                 # Validation de Supervisor PRO - Template Method
                 try:
                     model_pro = get_supervisor_pro_model(temperature=0.1)
-                    response = model_pro.invoke("Di solo 'OK' si funcionas")
+                    response = self._run_with_timeout(
+                        "Supervisor PRO",
+                        lambda: model_pro.invoke("Di solo 'OK' si funcionas"),
+                        MODEL_PROBE_TIMEOUT,
+                    )
                     # Validation de respuesta esperada - Specification Pattern
-                    if "OK" in response.content.upper():
-                        print("✅ Modelo Supervisor PRO funcionando")
+                    if _OK_RE.search(response.content):
+                        self._emit("✅ Modelo Supervisor PRO funcionando")
                         self.successes.append("Supervisor PRO operativo")
                     else:
-                        print("⚠️ Supervisor PRO responde pero de manera inesperada")
+                        self._emit("⚠️ Supervisor PRO responde pero de manera inesperada")
                         self.warnings.append("Supervisor PRO respuesta inesperada")
                 except Exception as e:
-                    print(f"❌ Error en Supervisor PRO: {e}")
+                    self._emit(f"❌ Error en Supervisor PRO: {e}")
                     self.errors.append(f"Supervisor PRO: {e}")
                 
                 # Validation de Supervisor CONTRA - Template Method (variante)
                 try:
                     model_contra = get_supervisor_contra_model(temperature=0.1)
-                    response = model_contra.invoke("Di solo 'OK' si funcionas")
+                    response = self._run_with_timeout(
+                        "Supervisor CONTRA",
+                        lambda: model_contra.invoke("Di solo 'OK' si funcionas"),
+                        MODEL_PROBE_TIMEOUT,
+                    )
                     # Validation de respuesta esperada - Specification Pattern
-                    if "OK" in response.content.upper():
-                        print("✅ Modelo Supervisor CONTRA funcionando")
+                    if _OK_RE.search(response.content):
+                        self._emit("✅ Modelo Supervisor CONTRA funcionando")
                         self.successes.append("Supervisor CONTRA operativo")
                     else:
-                        print("⚠️ Supervisor CONTRA responde pero de manera inesperada")
+                        self._emit("⚠️ Supervisor CONTRA responde pero de manera inesperada")
                         self.warnings.append("Supervisor CONTRA respuesta inesperada")
                 except Exception as e:
-                    print(f"❌ Error en Supervisor CONTRA: {e}")
+                    self._emit(f"❌ Error en Supervisor CONTRA: {e}")
                     self.errors.append(f"Supervisor CONTRA: {e}")
                 
                 # Validation de modelos de Agentes - Template Method (variante)
                 try:
                     agent_model = get_agent_model(temperature=0.1)
-                    response = agent_model.invoke("Di solo 'OK' si funcionas")
+                    response = self._run_with_timeout(
+                        "Modelo de Agentes",
+                        lambda: agent_model.invoke("Di solo 'OK' si funcionas"),
+                        MODEL_PROBE_TIMEOUT,
+                    )
                     # Validation de respuesta esperada - Specification Pattern
-                    if "OK" in response.content.upper():
-                        print("✅ Modelo de Agentes funcionando")
+                    if _OK_RE.search(response.content):
+                        self._emit("✅ Modelo de Agentes funcionando")
                         self.successes.append("Modelo de Agentes operativo")
                     else:
-                        print("⚠️ Modelo de Agentes responde pero de manera inesperada")
+                        self._emit("⚠️ Modelo de Agentes responde pero de manera inesperada")
                         self.warnings.append("Modelo de Agentes respuesta inesperada")
                 except Exception as e:
-                    print(f"❌ Error en Modelo de Agentes: {e}")
+                    self._emit(f"❌ Error en Modelo de Agentes: {e}")
                     self.errors.append(f"Modelo de Agentes: {e}")
                     
             else:
-                print("❌ No se puede conectar con GitHub Models")
+                self._emit("❌ No se puede conectar con GitHub Models")
                 self.errors.append("GitHub Models no disponible")
                 
         except Exception as e:
             # Global exception handling - Defensive Programming
-            print(f"❌ Error general en modelos: {e}")
+            self._emit(f"❌ Error general en modelos: {e}")
             self.errors.append(f"Modelos generales: {e}")
 
+        # Volcado atómico de la sección - Batched I/O
+        self._flush()
+
     def validate_search_system(self) -> None:
         """
         Valida la configuración y funcionalidad del sistema de búsqueda.
@@ -359,43 +637,60 @@ class SystemValidator:
         self.print_section("SISTEMA DE BÚSQUEDA")
         
         try:
-            # Instanciación del sistema de búsqueda - Factory Pattern
-            search_system = SearchSystem()
-            status = search_system.get_status()
+            # Instancia memoizada del sistema de búsqueda - Lazy Init
+            if SystemValidator._search_system is None:
+                SystemValidator._search_system = SearchSystem()
+            search_system = SystemValidator._search_system
+
+            # Status cacheado con TTL corto - Memoization Pattern
+            now = time.monotonic()
+            cached = SystemValidator._search_status_cache
+            if cached is not None and now - cached[0] < self._SEARCH_STATUS_TTL:
+                status = cached[1]
+            else:
+                status = search_system.get_status()
+                SystemValidator._search_status_cache = (now, status)
             
             # Display detallado de estado - Observer Pattern
-            print(f"📊 Estado del sistema de búsqueda:")
+            self._emit(f"📊 Estado del sistema de búsqueda:")
             for key, value in status.items():
                 symbol = "✅" if value else "❌"  # Visual feedback mapping
-                print(f"   {symbol} {key}: {value}")
+                self._emit(f"   {symbol} {key}: {value}")
             
             # Conditional functional testing - Strategy Pattern
             if status["can_search"]:
                 # Test de búsqueda real - Integration Testing
                 try:
-                    results = search_system.search("test python programming", max_results=1)
+                    results = self._run_with_timeout(
+                        "Búsqueda de prueba",
+                        lambda: search_system.search("test python programming", max_results=1),
+                        SEARCH_PROBE_TIMEOUT,
+                    )
                     if results:
-                        print("✅ Búsqueda de prueba exitosa")
+                        self._emit("✅ Búsqueda de prueba exitosa")
                         self.successes.append("Sistema de búsqueda operativo")
                     else:
-                        print("⚠️ Búsqueda funciona pero no devolvió resultados")
+                        self._emit("⚠️ Búsqueda funciona pero no devolvió resultados")
                         self.warnings.append("Búsqueda sin resultados")
                 except Exception as e:
-                    print(f"❌ Error en búsqueda de prueba: {e}")
+                    self._emit(f"❌ Error en búsqueda de prueba: {e}")
                     self.errors.append(f"Búsqueda: {e}")
             else:
                 # Configuration guidance - Help System Pattern
-                print("❌ Sistema de búsqueda no puede funcionar")
+                self._emit("❌ Sistema de búsqueda no puede funcionar")
                 self.errors.append("Sistema de búsqueda no configurado")
-                print("💡 Para habilitar búsquedas:")
-                print("   1. Obtén API key en: https://tavily.com/")
-                print("   2. Agrégala a .env: TAVILY_API_KEY=tu_key_aqui")
+                self._emit("💡 Para habilitar búsquedas:")
+                self._emit("   1. Obtén API key en: https://tavily.com/")
+                self._emit("   2. Agrégala a .env: TAVILY_API_KEY=tu_key_aqui")
                 
         except Exception as e:
             # Global exception handling con contexto específico
-            print(f"❌ Error general en sistema de búsqueda: {e}")
+            self._emit(f"❌ Error general en sistema de búsqueda: {e}")
             self.errors.append(f"Búsqueda general: {e}")
 
+        # Volcado atómico de la sección - Batched I/O
+        self._flush()
+
     def validate_debate_components(self) -> None:
         """
         Valida la funcionalidad de componentes específicos del dominio de debates.
@@ -441,33 +736,38 @@ class SystemValidator:
         self.print_section("COMPONENTES DEL DEBATE")
         
         try:
+            # Carga lazy y cacheada de los módulos del dominio
+            # (AgentRole ya está importado en la cabecera del módulo)
+            if SystemValidator._domain_modules is None:
+                from src.agents.SlaveAgent import SlaveAgent
+                from src.agents.SupervisorAgent import SupervisorAgent
+                from src.agents.debate_graph import DebateOrchestrator, DebateConfig
+                SystemValidator._domain_modules = (
+                    SlaveAgent, SupervisorAgent, DebateOrchestrator, DebateConfig
+                )
+            SlaveAgent, SupervisorAgent, DebateOrchestrator, DebateConfig = \
+                SystemValidator._domain_modules
+
             # Validation de SlaveAgent - Domain Object Testing
-            from src.agents.SlaveAgent import SlaveAgent
-            from src.config import AgentRole
-            
             # Test de instanciación con configuración mínima
             test_agent = SlaveAgent(role=AgentRole.CIENTIFICO, team="pro")
-            print("✅ SlaveAgent se puede crear")
+            self._emit("✅ SlaveAgent se puede crear")
             self.successes.append("SlaveAgent funcional")
-            
+
             # Validation de SupervisorAgent - Aggregate Root Testing
-            from src.agents.SupervisorAgent import SupervisorAgent
-            
             # Test de instanciación con dependencias complejas
             test_supervisor = SupervisorAgent(
                 team="pro",
                 position="Test position",
                 supervisor_id="test_supervisor"
             )
-            print("✅ SupervisorAgent se puede crear")
+            self._emit("✅ SupervisorAgent se puede crear")
             self.successes.append("SupervisorAgent funcional")
             
             # Validation de DebateOrchestrator - Application Service Testing
-            from src.agents.debate_graph import DebateOrchestrator, DebateConfig
-            
             # Test de instanciación de orquestador principal
             orchestrator = DebateOrchestrator()
-            print("✅ DebateOrchestrator se puede crear")
+            self._emit("✅ DebateOrchestrator se puede crear")
             self.successes.append("DebateOrchestrator funcional")
             
             # Validation de DebateConfig - Value Object Testing
@@ -477,14 +777,17 @@ class SystemValidator:
                 contra_position="Test contra position",
                 max_rounds=1
             )
-            print("✅ DebateConfig se puede crear")
+            self._emit("✅ DebateConfig se puede crear")
             self.successes.append("DebateConfig funcional")
             
         except Exception as e:
             # Domain-specific error handling
-            print(f"❌ Error en componentes del debate: {e}")
+            self._emit(f"❌ Error en componentes del debate: {e}")
             self.errors.append(f"Componentes del debate: {e}")
 
+        # Volcado atómico de la sección - Batched I/O
+        self._flush()
+
     def validate_imports(self) -> None:
         """
         Valida la disponibilidad de todas las dependencias críticas del sistema.
@@ -536,18 +839,32 @@ class SystemValidator:
             ("logging", "logging")             # Sistema de logging
         ]
         
+        # Módulos que deben importarse completamente (ejecutan validaciones
+        # en tiempo de importación, p.ej. carga de .env) - Allow-list
+        eager_imports = {"dotenv"}
+
         # Iteración de validation de dependencias - Iterator Pattern
         for module, name in required_imports:
             try:
-                # Dynamic import testing - Strategy Pattern
-                __import__(module)
-                print(f"✅ {name} importado correctamente")
+                if module in eager_imports:
+                    # Import completo solo para módulos que lo requieren
+                    __import__(module)
+                else:
+                    # Lookup del spec sin ejecutar el código del módulo:
+                    # evita cargar grafos de dependencias pesados (langchain,
+                    # langgraph, openai) solo para saber si están instalados
+                    if importlib.util.find_spec(module) is None:
+                        raise ImportError(f"No module named '{module}'")
+                self._emit(f"✅ {name} importado correctamente")
                 self.successes.append(f"{name} disponible")
             except ImportError:
                 # Dependency missing handling - Error Recovery
-                print(f"❌ {name} no está instalado")
+                self._emit(f"❌ {name} no está instalado")
                 self.errors.append(f"{name} faltante")
 
+        # Volcado atómico de la sección - Batched I/O
+        self._flush()
+
     def run_full_validation(self) -> bool:
         """
         Ejecuta el proceso completo de validación del sistema.
@@ -597,9 +914,11 @@ class SystemValidator:
         self.print_header("VALIDACIÓN COMPLETA DEL SISTEMA DE DEBATES")
         
         # Performance monitoring - Timing Pattern
-        start_time = datetime.now()
+        # perf_counter: reloj monotónico de alta resolución, inmune a
+        # ajustes del reloj de pared y sin asignar objetos datetime
+        start_time = time.perf_counter()
         
-        print("🎯 Validando que el sistema esté listo para debates reales...")
+        self._emit("🎯 Validando que el sistema esté listo para debates reales...")
         
         # Ejecución secuencial de validaciones - Template Method Pattern
         # Orden específico para dependencies y logical flow
@@ -607,52 +926,98 @@ class SystemValidator:
         self.validate_environment()       # 2. Configuration after dependencies
         self.validate_models()            # 3. External services after config
         self.validate_search_system()     # 4. Additional services
-        self.validate_debate_components() # 5. Domain components last
+
+        # 5. Domain components last - Short-Circuit Evaluation
+        # Si faltan las dependencias base no tiene sentido pagar el coste
+        # de importar el stack de agentes solo para verlo fallar
+        if any("LangChain" in e or "LangGraph" in e for e in self.errors):
+            self._emit("\n⏭️ Componentes del debate omitidos: dependencias base faltantes")
+            self.warnings.append("Componentes del debate omitidos: dependencias base faltantes")
+            self._flush()
+        else:
+            self.validate_debate_components()
         
         # Performance measurement - Metrics Collection
-        end_time = datetime.now()
-        duration = end_time - start_time
-        
+        duration_s = time.perf_counter() - start_time
+
         # Results aggregation y reporting - Observer Pattern
         self.print_section("RESUMEN DE VALIDACIÓN")
-        
-        print(f"⏱️ Validación completada en: {duration}")
-        print(f"✅ Éxitos: {len(self.successes)}")
-        print(f"⚠️ Advertencias: {len(self.warnings)}")
-        print(f"❌ Errores: {len(self.errors)}")
+
+        self._emit(f"⏱️ Validación completada en: {duration_s:.3f}s")
+        self._emit(f"✅ Éxitos: {len(self.successes)}")
+        self._emit(f"⚠️ Advertencias: {len(self.warnings)}")
+        self._emit(f"❌ Errores: {len(self.errors)}")
         
         # Decision logic basada en results - Strategy Pattern
         if self.errors:
             # Critical errors present - System not ready
-            print("\n❌ ERRORES CRÍTICOS ENCONTRADOS:")
-            for i, error in enumerate(self.errors, 1):
-                print(f"   {i}. {error}")
-            print("\n🔧 ACCIÓN REQUERIDA: Corregir errores antes de ejecutar debates")
+            self._emit("\n❌ ERRORES CRÍTICOS ENCONTRADOS:")
+            # Construcción única del listado - Batched String Building
+            self._emit("\n".join(f"   {i}. {e}" for i, e in enumerate(self.errors, 1)))
+            self._emit("\n🔧 ACCIÓN REQUERIDA: Corregir errores antes de ejecutar debates")
+            self._flush()
             return False
         
         elif self.warnings:
             # Warnings present but no critical errors - System ready with caveats
-            print("\n⚠️ ADVERTENCIAS ENCONTRADAS:")
-            for i, warning in enumerate(self.warnings, 1):
-                print(f"   {i}. {warning}")
-            print("\n💡 RECOMENDACIÓN: Revisar advertencias para mejor rendimiento")
+            self._emit("\n⚠️ ADVERTENCIAS ENCONTRADAS:")
+            # Construcción única del listado - Batched String Building
+            self._emit("\n".join(f"   {i}. {w}" for i, w in enumerate(self.warnings, 1)))
+            self._emit("\n💡 RECOMENDACIÓN: Revisar advertencias para mejor rendimiento")
+            self._flush()
             return True
         
         else:
             # No errors or warnings - System fully ready
-            print("\n🎉 ¡SISTEMA COMPLETAMENTE LISTO!")
-            print("✅ Todos los componentes funcionan correctamente")
-            print("🚀 Puedes ejecutar debates sin problemas")
+            self._emit("\n🎉 ¡SISTEMA COMPLETAMENTE LISTO!")
+            self._emit("✅ Todos los componentes funcionan correctamente")
+            self._emit("🚀 Puedes ejecutar debates sin problemas")
+            self._flush()
             return True
 
-    def get_system_info(self) -> None:
+    def run(self) -> ValidationResult:
+        """
+        Ejecuta la validación completa y devuelve un resultado estructurado.
+
+        Variante orientada a librería de run_full_validation: encapsula
+        el booleano de éxito y la guía de próximos pasos en un
+        ValidationResult para que el renderizado (render_cli) sea
+        opcional y separado del cómputo.
+
+        Returns:
+            ValidationResult: Resultado inmutable de la validación
+        """
+        success = self.run_full_validation()
+
+        # Guía de próximos pasos según resultado - Strategy Pattern
+        if success:
+            next_steps = (
+                "🎭 LISTO PARA DEBATES!",
+                "📝 Puedes ejecutar:",
+                "   python test_real_debate_only.py",
+            )
+        else:
+            next_steps = (
+                "🛠️ SISTEMA NECESITA CONFIGURACIÓN",
+                "📖 Revisa la documentación y corrige los errores",
+            )
+
+        return ValidationResult(success=success, next_steps=next_steps)
+
+    def get_system_info(self, force: bool = False) -> None:
         """
         Muestra información detallada de la configuración actual del sistema.
-        
+
         Implementa el patrón Information Display para proporcionar una vista
         comprehensiva del estado de configuración del sistema. Útil para
         debugging y verificación de configuración.
-        
+
+        Args:
+            force (bool): Emite el dump completo aunque DEBUG_MODE esté
+                desactivado. Lo usa main() cuando el usuario pidió la
+                información explícitamente (--info/--verbose): un flag
+                explícito prevalece sobre la política quiet-by-default.
+
         Information Categories:
             - Core Configuration: Límites y parámetros principales
             - Environment Configuration: Settings específicos del ambiente
@@ -685,38 +1050,61 @@ class SystemValidator:
         
         # Asegurar que la configuración esté cargada - Lazy Loading
         Config.ensure_loaded()
-        
+
+        # Short-circuit fuera de modo debug - Quiet by Default
+        # El dump completo solo aporta valor en troubleshooting; en runs
+        # de producción se sustituye por una línea corta, salvo que el
+        # usuario lo haya pedido explícitamente (force)
+        if not force and not Config.DEBUG_MODE():
+            self._emit("ℹ️ Información detallada suprimida (activa DEBUG_MODE=True para verla)")
+            self._flush()
+            return
+
         # Core configuration display - Information Expert Pattern
-        print(f"🔧 Configuración actual:")
-        print(f"   - MAX_ROUNDS: {Config.MAX_ROUNDS()}")                    # Límite de rondas de debate
-        print(f"   - AGENTS_PER_TEAM: {Config.AGENTS_PER_TEAM()}")          # Agentes por equipo
-        print(f"   - MAX_FRAGMENTS_PER_AGENT: {Config.MAX_FRAGMENTS_PER_AGENT}")  # Límite de evidencia
-        print(f"   - MAX_QUERIES_PER_AGENT: {Config.MAX_QUERIES_PER_AGENT}")     # Límite de búsquedas
-        print(f"   - MIN_FRAGMENT_SCORE: {Config.MIN_FRAGMENT_SCORE}")           # Umbral de calidad
-        print(f"   - DEBUG_MODE: {Config.DEBUG_MODE()}")                     # Estado de debug
-        
+        # Todo el bloque se construye en memoria y se emite de una vez:
+        # una adquisición del lock de stdout y un syscall en lugar de N.
+        # La plantilla estática se rellena con los valores dinámicos
+        values = {
+            "max_rounds": Config.MAX_ROUNDS(),
+            "agents_per_team": Config.AGENTS_PER_TEAM(),
+            "max_fragments": Config.MAX_FRAGMENTS_PER_AGENT,
+            "max_queries": Config.MAX_QUERIES_PER_AGENT,
+            "min_fragment_score": Config.MIN_FRAGMENT_SCORE,
+            "debug_mode": Config.DEBUG_MODE(),
+        }
+        lines = [_SYS_INFO_TEMPLATE.format_map(values)]
+
         # Environment-specific configuration - Context Awareness
+        # Lista materializada (no generador) para que join pueda calcular
+        # el tamaño total y asignar el buffer resultado de una vez
         env_config = Config.get_environment_config()
-        print(f"\n🌍 Configuración de ambiente:")
-        for key, value in env_config.items():
-            print(f"   - {key}: {value}")
+        env_lines = [f"   - {key}: {value}" for key, value in env_config.items()]
+        lines.append("\n🌍 Configuración de ambiente:\n" + "\n".join(env_lines))
+
+        self._emit("\n".join(lines))
 
+        # Volcado atómico de la sección - Batched I/O
+        self._flush()
 
-def main() -> bool:
+
+def main(argv: Optional[List[str]] = None) -> bool:
     """
     Función principal para ejecutar el proceso completo de validación.
-    
+
     Implementa el patrón Main Controller para coordinar el flujo principal
     de validación del sistema, proporcionando una interfaz simple y clara
     para ejecutar todas las verificaciones necesarias.
-    
+
     Execution Flow:
-        1. Instanciación del validador
-        2. Display de información del sistema
+        1. Parseo de argumentos de línea de comandos
+        2. Instanciación del validador
         3. Ejecución de validación completa
-        4. Interpretación de resultados
+        4. Display de información del sistema (solo con --info o fallo)
         5. Guidance para próximos pasos
-        
+
+    Args:
+        argv (Optional[List[str]]): Argumentos de CLI; None usa sys.argv
+
     Returns:
         bool: True si el sistema está listo, False si necesita configuración
         
@@ -740,27 +1128,44 @@ def main() -> bool:
         - Puede realizar llamadas a servicios externos
         - Timing de execution para performance awareness
     """
+    # Parseo de argumentos - Command Line Interface
+    parser = argparse.ArgumentParser(
+        description="Validación completa del sistema de debates"
+    )
+    parser.add_argument(
+        "--info", "--verbose",
+        action="store_true",
+        dest="info",
+        help="Mostrar la información detallada del sistema aunque la validación pase"
+    )
+    parser.add_argument(
+        "--no-pause",
+        action="store_true",
+        help="No esperar Enter al finalizar (para CI/cron)"
+    )
+    args = parser.parse_args(argv)
+
     # Instanciación del validador - Factory Pattern
     validator = SystemValidator()
-    
-    # Display de información del sistema - Information Pattern
-    validator.get_system_info()
-    
+
     # Ejecución de validación completa - Template Method
-    success = validator.run_full_validation()
-    
-    # Conditional guidance basada en resultados - Strategy Pattern
-    if success:
-        # Success path - Sistema listo para uso
-        print("\n🎭 LISTO PARA DEBATES!")
-        print("📝 Puedes ejecutar:")
-        print("   python test_real_debate_only.py")
-    else:
-        # Failure path - Sistema necesita configuración
-        print("\n🛠️ SISTEMA NECESITA CONFIGURACIÓN")
-        print("📖 Revisa la documentación y corrige los errores")
-    
-    return success
+    # run() devuelve un resultado estructurado; el renderizado de la
+    # guía queda desacoplado en render_cli
+    result = validator.run()
+
+    # Display diferido de información del sistema - Lazy Evaluation
+    # El dump de configuración solo es útil para diagnóstico: se emite
+    # bajo demanda (--info) o cuando la validación falla, evitando el
+    # coste de carga/render en el camino rápido de éxito
+    # El flag explícito fuerza el dump aunque DEBUG_MODE esté apagado;
+    # en el camino de fallo se mantiene la política quiet-by-default
+    if args.info or not result.success:
+        validator.get_system_info(force=args.info)
+
+    # Renderizado separado del cómputo - Presentation Layer
+    render_cli(result)
+
+    return result.success
 
 
 # Entry Point Pattern - Ejecución condicional
@@ -784,6 +1189,13 @@ if __name__ == "__main__":
         - Standard Python idiom para executable modules
         - Clear separation entre library y application code
         - User-friendly interaction patterns
+        - Exit code estándar (0 éxito / 1 fallo) para scripting
     """
-    main()
-    input("\n👋 Presiona Enter para salir...")
\ No newline at end of file
+    success = main()
+
+    # Pausa interactiva solo para usuarios con terminal - CLI Ergonomics
+    # En CI/cron (stdout no es TTY) o con --no-pause se sale directamente
+    if sys.stdout.isatty() and "--no-pause" not in sys.argv:
+        input("\n👋 Presiona Enter para salir...")
+
+    sys.exit(0 if success else 1)
\ No newline at end of file
@@ -35,18 +35,34 @@ import streamlit as st
 import sys
 import os
 import time
+import queue
+import threading
+import functools
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union, Tuple
+from uuid import uuid4
+from dataclasses import dataclass
+from collections import deque, OrderedDict
+from itertools import islice
+from typing import Dict, List, Any, Final, Optional, Union, Tuple
 import json
 
+# Serialización JSON acelerada - Optional Dependency Pattern
+# orjson (backend en C/Rust) serializa ~5x más rápido que stdlib; si no
+# está instalado se degrada a json sin cambios funcionales
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuración del path del proyecto para importaciones relativas
 # Aplicando principio DRY (Don't Repeat Yourself) para path management
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Importaciones del sistema de debates - Dependency Injection Pattern
-from src.agents.debate_graph import DebateOrchestrator, DebateConfig
-from src.config import Config
-from system_validator import SystemValidator
+# Importaciones del sistema de debates - Lazy Import Pattern
+# Los módulos pesados (LangGraph/LangChain vía debate_graph, el
+# validador y Config) se importan dentro de las funciones que los usan:
+# el shell de la UI arranca sin cargar todo el stack de LLMs, y el coste
+# de import se paga una sola vez gracias a st.cache_resource.
 
 # Configuración inicial de Streamlit - Front Controller Pattern
 # Establece las propiedades globales de la aplicación web
@@ -58,8 +74,9 @@ st.set_page_config(
 )
 
 # Definición de estilos CSS personalizados - Separation of Concerns
-# Implementa el principio de separación entre presentación y lógica
-st.markdown("""
+# Constante de módulo: el string se construye una sola vez al importar,
+# no en cada rerun del script
+_CSS: Final[str] = """
 <style>
     /* Tarjeta principal del debate - Gradient design para engagement visual */
     .debate-card {
@@ -101,8 +118,155 @@ st.markdown("""
         border: 1px solid #e9ecef;
         text-align: center;
     }
+
+    /* Bloques <details> nativos que sustituyen a st.expander:
+       el colapso lo gestiona el navegador, sin widget Streamlit.
+       Selector acotado a la clase propia: un details{} global también
+       restylearía los widgets internos de Streamlit basados en
+       <details> (st.status, st.expander) */
+    details.key-points {
+        background: #f8f9fa;
+        border: 1px solid #e9ecef;
+        border-radius: 8px;
+        padding: 8px 12px;
+        margin: 10px 0;
+    }
+
+    details.key-points summary {
+        cursor: pointer;
+        font-weight: 600;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# HTML estático del header principal - Template Pattern
+_HEADER_HTML: Final[str] = """
+<div class="debate-card">
+    <h1>🎭 Sistema de Debates con IA</h1>
+    <p>Dos equipos de IA investigan y debaten sobre cualquier tema usando evidencia real</p>
+</div>
+"""
+
+# Temas predefinidos para la barra lateral - Strategy Pattern
+# Hoisted a nivel de módulo para no reconstruir el dict en cada rerun
+_PREDEFINED_TOPICS: Final[Dict[str, Dict[str, str]]] = {
+    "Personalizado": {"topic": "", "pro": "", "contra": ""},
+    "Inteligencia Artificial": {
+        "topic": "Impacto de la IA en el empleo",
+        "pro": "La IA creará más empleos de los que destruirá",
+        "contra": "La IA causará desempleo masivo y desigualdad"
+    },
+    "Trabajo Remoto": {
+        "topic": "Futuro del trabajo remoto",
+        "pro": "El trabajo remoto es más productivo y beneficioso",
+        "contra": "El trabajo presencial es esencial para la colaboración"
+    },
+    "Energía": {
+        "topic": "Transición energética",
+        "pro": "Las energías renovables son viables económicamente",
+        "contra": "Los combustibles fósiles siguen siendo necesarios"
+    },
+    "Educación": {
+        "topic": "Educación online vs presencial",
+        "pro": "La educación online es más accesible y efectiva",
+        "contra": "La educación presencial ofrece mejor desarrollo integral"
+    }
+}
+
+
+# Plantillas HTML precompiladas para tarjetas de argumento - Template Pattern
+# Hoisted a nivel de módulo: .format() sobre una constante evita
+# re-construir el literal f-string en cada iteración del transcript
+_ARGUMENT_CARD_TPL: Final[str] = (
+    '<div class="{css_class}">'
+    '<h4>{label} (Confianza: {confidence:.2f})</h4>'
+    '<p><strong>Estrategia:</strong> {strategy}</p>'
+    '<p>{content}</p>'
+    '</div>'
+)
+
+_KEY_POINTS_TPL: Final[str] = (
+    '<details class="key-points">'
+    '<summary>🔑 Puntos clave {team} - Ronda {round_num}</summary>'
+    '<ol>{items}</ol></details>'
+)
+
+_PREVIEW_GRID_TPL: Final[str] = """
+<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
+    <div class="pro-argument">
+        <h4>🟢 Equipo PRO</h4>
+        <p><strong>Posición:</strong> {pro_position}</p>
+        <small>Defenderá esta posición con evidencia científica, económica, histórica, psicológica y análisis crítico</small>
+    </div>
+    <div class="contra-argument">
+        <h4>🔴 Equipo CONTRA</h4>
+        <p><strong>Posición:</strong> {contra_position}</p>
+        <small>Refutará la posición PRO con evidencia especializada y contraargumentos</small>
+    </div>
+</div>
+"""
+
+# Mensajes por clase de margen de victoria - Lookup Table Pattern
+# La clasificación se calcula una vez al completar el debate; la vista
+# solo indexa esta tabla
+_MARGIN_MESSAGES: Final[Dict[str, str]] = {
+    "tight": "⚖️ Debate muy reñido",
+    "narrow": "🎯 Victoria por margen estrecho",
+    "clear": "🎯 Victoria clara",
+}
+
+# Campos de fragmento mostrados en el panel de evidencia, con sus
+# valores por defecto - una sola definición para el unpack en batch
+_FRAGMENT_FIELDS: Final[Tuple[Tuple[str, Any], ...]] = (
+    ("source", "N/A"),
+    ("title", "Sin título"),
+    ("final_score", 0),
+)
+
+# Reglas de validación de configuración - Specification Pattern
+# Triples (campo, longitud mínima, mensaje de error) hoisted a nivel de
+# módulo para no reconstruirlas en cada validación
+_VALIDATION_RULES: Final[Tuple[Tuple[str, int, str], ...]] = (
+    ("topic", 10, "El tema debe tener al menos 10 caracteres"),
+    ("pro_position", 20, "La posición PRO debe tener al menos 20 caracteres"),
+    ("contra_position", 20, "La posición CONTRA debe tener al menos 20 caracteres"),
+)
+
+
+@st.cache_data
+def _inject_css() -> None:
+    """
+    Inyecta los estilos CSS de la aplicación una sola vez.
+
+    st.cache_data reproduce los elementos estáticos en cache hits, por lo
+    que el pipeline de Markdown de Streamlit solo procesa el bloque CSS
+    la primera vez en lugar de en cada rerun.
+    """
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+
+_inject_css()
+
+
+@dataclass(slots=True)
+class StoredDebate:
+    """
+    Entrada compacta del historial de debates de la sesión.
+
+    dataclass con slots=True: aproximadamente la mitad de memoria por
+    entrada frente al dict anónimo anterior. El estado final del debate
+    ya NO vive aquí: se guarda una sola vez en _result_store() y el
+    historial solo retiene el id para rehidratarlo bajo demanda, de modo
+    que session_state se mantiene pequeño y barato de serializar.
+
+    Attributes:
+        id (str): Identificador único del debate (timestamp formateado).
+        config (Dict): Configuración con la que se ejecutó el debate.
+        timestamp (datetime): Momento de finalización.
+    """
+    id: str
+    config: Dict[str, Union[str, int]]
+    timestamp: datetime
 
 
 def initialize_session_state() -> None:
@@ -115,7 +279,7 @@ def initialize_session_state() -> None:
     Estado Gestionado:
         - debate_running (bool): Flag de ejecución de debate activo
         - debate_result (Optional[Dict]): Resultados del último debate ejecutado
-        - debate_history (List[Dict]): Historial de debates de la sesión
+        - debate_history (Deque[StoredDebate]): Historial acotado de debates de la sesión
         - current_debate_id (Optional[str]): Identificador único del debate actual
     
     Design Pattern:
@@ -136,11 +300,181 @@ def initialize_session_state() -> None:
         st.session_state.debate_result = None
     
     if 'debate_history' not in st.session_state:
-        st.session_state.debate_history = []
+        # deque acotada: el historial no crece sin límite en sesiones
+        # largas, las entradas más antiguas se descartan solas
+        st.session_state.debate_history = deque(maxlen=50)
     
     if 'current_debate_id' not in st.session_state:
         st.session_state.current_debate_id = None
 
+    if 'session_id' not in st.session_state:
+        # Prefijo de las claves del store de resultados: los ids de
+        # debate son timestamps de segundo y colisionarían entre usuarios
+        st.session_state.session_id = uuid4().hex
+
+
+@st.cache_resource
+def get_validator() -> "SystemValidator":
+    """
+    Construye (una sola vez por proceso) el validador del sistema.
+
+    Streamlit re-ejecuta el script completo en cada interacción, por lo
+    que instanciar SystemValidator inline lo reconstruiría en cada rerun.
+    st.cache_resource garantiza una única instancia compartida.
+
+    Returns:
+        SystemValidator: Instancia única del validador.
+    """
+    from system_validator import SystemValidator
+    return SystemValidator()
+
+
+def get_orchestrator() -> "DebateOrchestrator":
+    """
+    Construye (una sola vez por sesión) el orquestador de debates.
+
+    El orquestador compila el grafo de LangGraph y prepara los clientes
+    LLM, un coste de construcción que no debe pagarse en cada rerun ni
+    en cada click de "iniciar debate". La instancia vive en
+    session_state y NO en st.cache_resource: run_debate muta estado de
+    instancia por ejecución (supervisores, callback de eventos, flags de
+    paralelismo), así que un singleton de proceso compartido entre
+    sesiones corrompería debates concurrentes de distintos usuarios.
+
+    Returns:
+        DebateOrchestrator: Instancia única de la sesión.
+    """
+    if '_orchestrator' not in st.session_state:
+        from src.agents.debate_graph import DebateOrchestrator
+        st.session_state._orchestrator = DebateOrchestrator()
+    return st.session_state._orchestrator
+
+
+# Techo global del store de resultados - Bounded Cache
+# A diferencia de session_state (que Streamlit libera al cerrar la
+# sesión), un st.cache_resource vive lo que viva el proceso: sin techo,
+# los resultados de sesiones muertas se acumularían indefinidamente
+_RESULT_STORE_MAX: Final[int] = 100
+
+
+@st.cache_resource
+def get_result_store() -> "OrderedDict[str, Dict[str, Any]]":
+    """
+    Almacén de resultados de debates a nivel de proceso.
+
+    Los estados finales de los debates son dicts grandes (argumentos,
+    fragmentos, resúmenes). Mantenerlos dentro de session_state obliga a
+    Streamlit a serializar todo el historial en cada interacción; este
+    store los guarda una sola vez por proceso y el historial conserva
+    únicamente el id con el que rehidratarlos.
+
+    Las claves se componen con _store_key: el prefijo de sesión evita
+    colisiones entre usuarios (los ids de debate son timestamps con
+    resolución de segundo). El store está doblemente acotado: la entrada
+    se elimina cuando la deque de historial desaloja su referencia, y
+    _store_result impone además un techo LRU global (_RESULT_STORE_MAX)
+    que descarta lo menos usado — incluidos los huérfanos de sesiones ya
+    cerradas, que ningún otro camino limpiaría.
+
+    Acceder siempre vía _store_result/_load_result, que mantienen el
+    orden LRU del OrderedDict.
+
+    Returns:
+        OrderedDict[str, Dict[str, Any]]: Mapa clave de sesión+debate ->
+            estado final, en orden de último uso.
+    """
+    return OrderedDict()
+
+
+def _store_result(key: str, result: Dict[str, Any]) -> None:
+    """
+    Inserta un resultado en el store aplicando el techo LRU global.
+
+    Args:
+        key (str): Clave sesión:debate (ver _store_key).
+        result (Dict[str, Any]): Estado final del debate.
+    """
+    store = get_result_store()
+    store[key] = result
+    store.move_to_end(key)
+    while len(store) > _RESULT_STORE_MAX:
+        store.popitem(last=False)  # Descarta la entrada menos usada
+
+
+def _load_result(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Recupera un resultado del store refrescando su posición LRU.
+
+    Args:
+        key (str): Clave sesión:debate (ver _store_key).
+
+    Returns:
+        Optional[Dict[str, Any]]: Estado final, o None si la entrada fue
+            desalojada (por la deque de historial o por el techo LRU).
+    """
+    store = get_result_store()
+    result = store.get(key)
+    if result is not None:
+        store.move_to_end(key)
+    return result
+
+
+def _store_key(debate_id: str) -> str:
+    """
+    Compone la clave del store de resultados para esta sesión.
+
+    Args:
+        debate_id (str): Identificador del debate (timestamp formateado).
+
+    Returns:
+        str: Clave "session_id:debate_id" única entre sesiones.
+    """
+    return f"{st.session_state.session_id}:{debate_id}"
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_config_snapshot() -> Dict[str, Any]:
+    """
+    Toma (una sola vez) una instantánea de los valores de Config.
+
+    Los accessors de Config pueden releer variables de entorno; este
+    snapshot memoizado evita pagar esos accesos en cada rerun del
+    sidebar. Se invalida con _cached_config_snapshot.cache_clear()
+    (botón "Recargar configuración").
+
+    Returns:
+        Dict[str, Any]: Valores de configuración mostrados en el sidebar.
+    """
+    from src.config import Config
+    return {
+        "agents": Config.AGENTS_PER_TEAM(),
+        "fragments": Config.MAX_FRAGMENTS_PER_AGENT,
+        "queries": Config.MAX_QUERIES_PER_AGENT,
+        "debug": Config.DEBUG_MODE()
+    }
+
+
+@st.cache_data
+def get_config_summary() -> str:
+    """
+    Genera (y cachea) el resumen de configuración para la barra lateral.
+
+    Los valores provienen del snapshot memoizado de Config y no cambian
+    durante la vida del proceso, así que el string se construye una sola
+    vez en lugar de re-consultar la configuración en cada rerun.
+
+    Returns:
+        str: Resumen en Markdown del estado de la configuración.
+    """
+    snapshot = _cached_config_snapshot()
+    return f"""
+    **Configuración actual:**
+    - Agentes por equipo: {snapshot['agents']}
+    - Fragmentos por agente: {snapshot['fragments']}
+    - Queries por agente: {snapshot['queries']}
+    - Debug mode: {snapshot['debug']}
+    """
+
 
 def validate_system() -> bool:
     """
@@ -167,28 +501,55 @@ def validate_system() -> bool:
         - Puede mostrar mensajes de error en la UI
         - Puede terminar la ejecución de la aplicación
     """
-    # Instanciación del validador - Dependency Injection
-    validator = SystemValidator()
-    
-    # Validación rápida del sistema con manejo de excepciones
+    # Chequeo memoizado (ttl=300): el resultado no cambia intra-sesión,
+    # así que los reruns no repiten la carga/validación de configuración
+    ok, error = _system_check()
+    if ok:
+        return True
+
+    # Error handling con feedback inmediato al usuario
+    st.error(f"❌ Error en configuración: {error}")
+    st.stop()  # Fail-fast: detener ejecución si el sistema no está listo
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _system_check() -> Tuple[bool, str]:
+    """
+    Ejecuta (y memoiza) el chequeo de configuración del sistema.
+
+    Separa el probe de la presentación: esta función solo devuelve el
+    resultado, sin tocar la UI, para poder cachearla con st.cache_data.
+    El ttl de 5 minutos permite detectar arreglos de configuración sin
+    reiniciar el proceso.
+
+    Returns:
+        Tuple[bool, str]: (éxito, mensaje de error si lo hubo).
+    """
+    validator = get_validator()
+
     try:
-        # Asegurar que la configuración esté cargada
+        # Asegurar que la configuración esté cargada (import diferido)
+        from src.config import Config
         Config.ensure_loaded()
-        return True
+        return True, ""
     except Exception as e:
-        # Error handling con feedback inmediato al usuario
-        st.error(f"❌ Error en configuración: {e}")
-        st.stop()  # Fail-fast: detener ejecución si el sistema no está listo
+        return False, str(e)
 
 
 def sidebar_configuration() -> Dict[str, Union[str, int]]:
     """
     Genera la configuración del debate mediante la barra lateral interactiva.
-    
+
     Implementa el patrón Strategy para diferentes tipos de configuración de debates,
     permitiendo tanto temas predefinidos como configuración personalizada. Utiliza
     el patrón Template Method para la estructura de configuración.
-    
+
+    Nota: esta función NO puede ser un @st.fragment — Streamlit prohíbe
+    st.sidebar.* dentro de fragments, y además la validación del cuerpo
+    principal debe re-ejecutarse con cada cambio de configuración. El
+    scope de fragment queda para los renderizadores de resultados. La
+    configuración se publica también en st.session_state.debate_config.
+
     Returns:
         Dict[str, Union[str, int]]: Diccionario con la configuración del debate
             - topic (str): Tema del debate
@@ -209,36 +570,11 @@ def sidebar_configuration() -> Dict[str, Union[str, int]]:
     # Header de la barra lateral con diseño de información jerárquica
     st.sidebar.header("⚙️ Configuración del Debate")
     
-    # Definición de temas predefinidos - Strategy Pattern
-    # Cada tema implementa una estrategia específica de debate
-    predefined_topics: Dict[str, Dict[str, str]] = {
-        "Personalizado": {"topic": "", "pro": "", "contra": ""},
-        "Inteligencia Artificial": {
-            "topic": "Impacto de la IA en el empleo",
-            "pro": "La IA creará más empleos de los que destruirá",
-            "contra": "La IA causará desempleo masivo y desigualdad"
-        },
-        "Trabajo Remoto": {
-            "topic": "Futuro del trabajo remoto",
-            "pro": "El trabajo remoto es más productivo y beneficioso",
-            "contra": "El trabajo presencial es esencial para la colaboración"
-        },
-        "Energía": {
-            "topic": "Transición energética",
-            "pro": "Las energías renovables son viables económicamente",
-            "contra": "Los combustibles fósiles siguen siendo necesarios"
-        },
-        "Educación": {
-            "topic": "Educación online vs presencial",
-            "pro": "La educación online es más accesible y efectiva",
-            "contra": "La educación presencial ofrece mejor desarrollo integral"
-        }
-    }
-    
     # Selector de tema con patrón de selección estratégica
+    # Los temas predefinidos viven en _PREDEFINED_TOPICS (nivel de módulo)
     selected_topic = st.sidebar.selectbox(
         "🎯 Tema del debate:",
-        list(predefined_topics.keys())
+        list(_PREDEFINED_TOPICS.keys())
     )
     
     # Lógica condicional para configuración personalizada vs predefinida
@@ -250,7 +586,7 @@ def sidebar_configuration() -> Dict[str, Union[str, int]]:
         contra_position = st.sidebar.text_area("🔴 Posición CONTRA:")
     else:
         # Configuración basada en plantilla - eficiencia y consistencia
-        topic_data = predefined_topics[selected_topic]
+        topic_data = _PREDEFINED_TOPICS[selected_topic]
         topic = st.sidebar.text_input("📝 Tema del debate:", value=topic_data["topic"])
         pro_position = st.sidebar.text_area("🟢 Posición PRO:", value=topic_data["pro"])
         contra_position = st.sidebar.text_area("🔴 Posición CONTRA:", value=topic_data["contra"])
@@ -264,16 +600,16 @@ def sidebar_configuration() -> Dict[str, Union[str, int]]:
     
     # Información del estado del sistema - Transparency Principle
     st.sidebar.subheader("📊 Estado del Sistema")
-    st.sidebar.info(f"""
-    **Configuración actual:**
-    - Agentes por equipo: {Config.AGENTS_PER_TEAM()}
-    - Fragmentos por agente: {Config.MAX_FRAGMENTS_PER_AGENT}
-    - Queries por agente: {Config.MAX_QUERIES_PER_AGENT}
-    - Debug mode: {Config.DEBUG_MODE()}
-    """)
-    
-    # Retorno de configuración estructurada - Data Transfer Object Pattern
-    return {
+    st.sidebar.info(get_config_summary())
+
+    # Invalidación manual del snapshot - Cache Invalidation Pattern
+    if st.sidebar.button("🔄 Recargar configuración"):
+        _cached_config_snapshot.cache_clear()
+        get_config_summary.clear()
+        st.rerun()
+    
+    # Configuración estructurada - Data Transfer Object Pattern
+    config = {
         "topic": topic,
         "pro_position": pro_position,
         "contra_position": contra_position,
@@ -281,6 +617,11 @@ def sidebar_configuration() -> Dict[str, Union[str, int]]:
         "timeout_minutes": timeout_minutes
     }
 
+    # Publicación para consumidores fuera del flujo de main()
+    st.session_state.debate_config = config
+
+    return config
+
 
 def display_main_header() -> None:
     """
@@ -298,13 +639,8 @@ def display_main_header() -> None:
     Side Effects:
         Renderiza contenido HTML en la interfaz de Streamlit
     """
-    # Renderizado de header con HTML personalizado - Template Pattern
-    st.markdown("""
-    <div class="debate-card">
-        <h1>🎭 Sistema de Debates con IA</h1>
-        <p>Dos equipos de IA investigan y debaten sobre cualquier tema usando evidencia real</p>
-    </div>
-    """, unsafe_allow_html=True)
+    # Renderizado de header con HTML precomputado - Template Pattern
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 
 def validate_debate_config(config: Dict[str, Union[str, int]]) -> List[str]:
@@ -339,22 +675,54 @@ def validate_debate_config(config: Dict[str, Union[str, int]]) -> List[str]:
         Tiempo: O(n) donde n es el número de campos a validar
         Espacio: O(e) donde e es el número de errores encontrados
     """
-    # Lista de errores - Collector Pattern
+    # Delegación al validador memoizado: la validación es pura sobre los
+    # tres campos de texto, así que configs repetidas (reruns sin cambios
+    # en los textos) no repiten los chequeos de longitud
+    return list(_validate_fields(
+        config["topic"],
+        config["pro_position"],
+        config["contra_position"]
+    ))
+
+
+@functools.lru_cache(maxsize=64)
+def _validate_fields(topic: str, pro_position: str,
+                     contra_position: str) -> Tuple[str, ...]:
+    """
+    Valida los tres campos de texto del debate (memoizado).
+
+    Función pura sobre sus argumentos, cacheada con lru_cache para que
+    los reruns de Streamlit con textos sin cambios no repitan los pases
+    de validación ni la construcción de la lista de errores.
+
+    Args:
+        topic (str): Tema del debate.
+        pro_position (str): Posición del equipo PRO.
+        contra_position (str): Posición del equipo CONTRA.
+
+    Returns:
+        Tuple[str, ...]: Mensajes de error; tupla vacía si todo es válido.
+    """
+    values = {
+        "topic": topic,
+        "pro_position": pro_position,
+        "contra_position": contra_position
+    }
+
     errors: List[str] = []
-    
-    # Validación del tema - Business Rule: Contexto suficiente
-    if not config["topic"] or len(config["topic"].strip()) < 10:
-        errors.append("El tema debe tener al menos 10 caracteres")
-    
-    # Validación de posición PRO - Business Rule: Argumento substantivo
-    if not config["pro_position"] or len(config["pro_position"].strip()) < 20:
-        errors.append("La posición PRO debe tener al menos 20 caracteres")
-    
-    # Validación de posición CONTRA - Business Rule: Contra-argumento substantivo
-    if not config["contra_position"] or len(config["contra_position"].strip()) < 20:
-        errors.append("La posición CONTRA debe tener al menos 20 caracteres")
-    
-    return errors
+
+    # Aplicación de reglas desde _VALIDATION_RULES (nivel de módulo).
+    # strip() solo se paga cuando hay whitespace en los extremos que
+    # podría reducir la longitud efectiva; el caso común (texto ya
+    # recortado y suficientemente largo) no asigna copias.
+    for field, min_len, message in _VALIDATION_RULES:
+        value = values[field]
+        if not value or len(value) < min_len:
+            errors.append(message)
+        elif (value[0].isspace() or value[-1].isspace()) and len(value.strip()) < min_len:
+            errors.append(message)
+
+    return tuple(errors)
 
 
 def create_debate_preview(config: Dict[str, Union[str, int]]) -> None:
@@ -381,29 +749,17 @@ def create_debate_preview(config: Dict[str, Union[str, int]]) -> None:
     Side Effects:
         Renderiza contenido HTML y Markdown en Streamlit
     """
-    # Layout en dos columnas para representar la naturaleza dual del debate
-    col1, col2 = st.columns(2)
-    
-    # Columna izquierda - Equipo PRO (color psychology: verde = positivo)
-    with col1:
-        st.markdown(f"""
-        <div class="pro-argument">
-            <h4>🟢 Equipo PRO</h4>
-            <p><strong>Posición:</strong> {config['pro_position']}</p>
-            <small>Defenderá esta posición con evidencia científica, económica, histórica, psicológica y análisis crítico</small>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Columna derecha - Equipo CONTRA (color psychology: rojo = oposición)
-    with col2:
-        st.markdown(f"""
-        <div class="contra-argument">
-            <h4>🔴 Equipo CONTRA</h4>
-            <p><strong>Posición:</strong> {config['contra_position']}</p>
-            <small>Refutará la posición PRO con evidencia especializada y contraargumentos</small>
-        </div>
-        """, unsafe_allow_html=True)
-    
+    # Grid CSS de dos columnas desde plantilla precompilada:
+    # representa la naturaleza dual del debate sin crear columnas
+    # Streamlit adicionales (verde = positivo, rojo = oposición)
+    st.markdown(
+        _PREVIEW_GRID_TPL.format(
+            pro_position=config['pro_position'],
+            contra_position=config['contra_position']
+        ),
+        unsafe_allow_html=True
+    )
+
     # Resumen de configuración - Information Summary Pattern
     st.markdown(f"""
     **📋 Configuración del debate:**
@@ -459,8 +815,7 @@ def run_debate_with_progress(config: Dict[str, Union[str, int]]) -> Optional[Dic
     with progress_container:
         st.subheader("🚀 Ejecutando Debate")
         progress_bar = st.progress(0)  # Inicialización de barra de progreso
-        status_text = st.empty()       # Placeholder para texto de estado
-        
+
         # Métricas en tiempo real - Dashboard Pattern
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -474,33 +829,119 @@ def run_debate_with_progress(config: Dict[str, Union[str, int]]) -> Optional[Dic
     
     try:
         # Transformación de configuración UI a configuración de dominio
-        # Data Transfer Object Pattern
+        # Data Transfer Object Pattern (import diferido del stack pesado)
+        from src.agents.debate_graph import DebateConfig
+
         debate_config = DebateConfig(
             topic=config["topic"],
             pro_position=config["pro_position"],
             contra_position=config["contra_position"],
             max_rounds=config["max_rounds"],
-            timeout_minutes=config["timeout_minutes"]
+            timeout_minutes=config["timeout_minutes"],
+            parallel_agents=True,  # Agentes de cada equipo investigan en paralelo
+            parallel_teams=True    # Investigación PRO y CONTRA concurrente
         )
         
         # Inicialización del orquestador - Factory Pattern
-        with status_container:
-            st.info("🏗️ Inicializando sistema de debates...")
-        
-        orchestrator = DebateOrchestrator()
-        
+        # st.status es un único contenedor nativo que Streamlit actualiza
+        # in-place vía status.update, en lugar de sobrescribir un st.empty
+        # con texto nuevo en cada transición
+        debate_status = status_container.status(
+            "🏗️ Inicializando sistema de debates...", expanded=False
+        )
+
+        orchestrator = get_orchestrator()
+
         # Actualización de progreso - Observer Pattern
         progress_bar.progress(10)
-        status_text.text("✅ Orquestador creado")
-        
-        # Simulación de progreso visual para mejor UX
-        status_text.text("🔍 Equipos investigando evidencia...")
-        progress_bar.progress(30)
-        
-        # Ejecución del debate - Command Pattern
-        start_time = time.time()
-        final_state = orchestrator.run_debate(debate_config)
-        end_time = time.time()
+        debate_status.update(label="🔍 Equipos investigando evidencia...", state="running")
+
+        # Ejecución del debate en segundo plano - Producer/Consumer Pattern
+        # El orquestador produce eventos de progreso en una cola y este
+        # bucle los consume para actualizar la UI reactivamente, en lugar
+        # de bloquear hasta el estado final con progreso simulado.
+        event_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        result_holder: Dict[str, Any] = {}
+
+        def _run_debate_worker() -> None:
+            try:
+                result_holder["state"] = orchestrator.run_debate(
+                    debate_config, on_event=event_queue.put
+                )
+            except Exception as exc:
+                result_holder["error"] = exc
+
+        worker = threading.Thread(target=_run_debate_worker, daemon=True)
+        # perf_counter: reloj monotónico, inmune a saltos de NTP que
+        # harían negativa o absurda la duración mostrada
+        start_time = time.perf_counter()
+        worker.start()
+
+        # Pasos esperados: 2 fases de investigación + 2 argumentos por ronda
+        total_steps = 2 + config["max_rounds"] * 2
+        completed_steps = 0
+
+        # Throttling de refrescos de UI - Rate Limiting Pattern
+        # Cada placeholder se reescribe como máximo cada 50 ms; los
+        # eventos intermedios se coalescen. El bloque final de métricas
+        # (tras el join) reescribe los valores definitivos, así que no
+        # se pierde información al descartar refrescos intermedios.
+        last_update: Dict[str, float] = {}
+
+        def _should_refresh(key: str, min_interval: float = 0.05) -> bool:
+            now = time.monotonic()
+            if now - last_update.get(key, 0.0) >= min_interval:
+                last_update[key] = now
+                return True
+            return False
+
+        # Bucle de consumo de eventos - Observer Pattern
+        while worker.is_alive() or not event_queue.empty():
+            try:
+                event = event_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            completed_steps += 1
+            if _should_refresh("progress"):
+                progress_bar.progress(min(95, 10 + int(85 * completed_steps / total_steps)))
+
+            if event["type"] == "research_completed":
+                if _should_refresh("status"):
+                    debate_status.update(
+                        label=(
+                            f"🔍 Investigación {event['team'].upper()} completada "
+                            f"({event['fragments']} fragmentos)"
+                        ),
+                        state="running"
+                    )
+                if _should_refresh("fragments"):
+                    with fragments_metric:
+                        st.metric("📊 Evidencia", f"{event['fragments']}", event['team'].upper())
+            elif event["type"] == "argument_added":
+                if _should_refresh("status"):
+                    debate_status.update(
+                        label=(
+                            f"💬 Argumento {event['team'].upper()} generado "
+                            f"(Ronda {event['round']})"
+                        ),
+                        state="running"
+                    )
+                if _should_refresh("arguments"):
+                    with arguments_metric:
+                        st.metric("💬 Argumentos", f"{event['total_arguments']}", "generados")
+                if _should_refresh("round"):
+                    with round_metric:
+                        st.metric("🔄 Ronda", f"{event['round']}/{config['max_rounds']}")
+
+        worker.join()
+        end_time = time.perf_counter()
+
+        # Propagar errores del hilo de trabajo al manejo de errores común
+        if "error" in result_holder:
+            raise result_holder["error"]
+
+        final_state = result_holder.get("state")
         
         # Actualización de métricas basadas en resultados - Data Binding
         if final_state:
@@ -522,16 +963,31 @@ def run_debate_with_progress(config: Dict[str, Union[str, int]]) -> Optional[Dic
                 st.metric("🔄 Ronda", f"{current_round}/{config['max_rounds']}")
             
             # Cálculo y visualización de confianza promedio
-            if final_state.get('final_scores'):
-                pro_conf = final_state['final_scores'].get('pro_average', 0)
-                contra_conf = final_state['final_scores'].get('contra_average', 0)
+            # (final_scores se lee una sola vez, sin cadenas de .get)
+            scores = final_state.get('final_scores') or {}
+            if scores:
+                pro_conf = scores.get('pro_average', 0)
+                contra_conf = scores.get('contra_average', 0)
                 avg_conf = (pro_conf + contra_conf) / 2
                 with confidence_metric:
                     st.metric("⭐ Confianza", f"{avg_conf:.2f}", "promedio")
+
+                # Clasificación del margen calculada una única vez aquí;
+                # display_results solo lee la etiqueta en cada rerun
+                margin = abs(pro_conf - contra_conf)
+                if margin < 0.05:
+                    final_state['margin_class'] = 'tight'
+                elif margin < 0.15:
+                    final_state['margin_class'] = 'narrow'
+                else:
+                    final_state['margin_class'] = 'clear'
         
         # Finalización de progreso con feedback de completitud
         progress_bar.progress(100)
-        status_text.text(f"✅ Debate completado en {end_time - start_time:.1f} segundos")
+        debate_status.update(
+            label=f"✅ Debate completado en {end_time - start_time:.1f} segundos",
+            state="complete"
+        )
         
         return final_state
         
@@ -541,10 +997,59 @@ def run_debate_with_progress(config: Dict[str, Union[str, int]]) -> Optional[Dic
         return None
 
 
+def _argument_card_html(argument: Dict[str, Any], team: str, round_num: int) -> str:
+    """
+    Construye el HTML de la tarjeta de un argumento (PRO o CONTRA).
+
+    Genera la tarjeta con metadatos del argumento y, si existen, los
+    puntos clave como un bloque <details> nativo del navegador en lugar
+    de un st.expander: el colapso lo maneja el DOM sin widget ni estado
+    de sesión de Streamlit.
+
+    Args:
+        argument (Dict[str, Any]): Argumento serializado con content,
+            confidence_score, strategy y key_points opcionales.
+        team (str): "pro" o "contra"; determina el estilo y etiqueta.
+        round_num (int): Número de ronda (1-based) para el rótulo.
+
+    Returns:
+        str: Fragmento HTML listo para concatenar al transcript.
+    """
+    confidence = argument.get('confidence_score', 0)
+    strategy = argument.get('strategy', 'unknown')
+
+    if team == "pro":
+        css_class, label = "pro-argument", "🟢 Supervisor PRO"
+    else:
+        css_class, label = "contra-argument", "🔴 Supervisor CONTRA"
+
+    html = _ARGUMENT_CARD_TPL.format(
+        css_class=css_class,
+        label=label,
+        confidence=confidence,
+        strategy=strategy.upper(),
+        content=argument.get('content', 'Sin contenido')
+    )
+
+    # Puntos clave colapsables - Progressive Disclosure sin widget
+    if argument.get('key_points'):
+        items = "".join(f"<li>{point}</li>" for point in argument['key_points'])
+        html += _KEY_POINTS_TPL.format(
+            team=team.upper(), round_num=round_num, items=items
+        )
+
+    return f"<div>{html}</div>"
+
+
+@st.fragment
 def display_live_debate(state: Optional[Dict[str, Any]]) -> None:
     """
     Visualiza la conversación del debate en formato interactivo.
-    
+
+    Decorada con @st.fragment para que la emisión del transcript solo se
+    re-ejecute en reruns del propio fragmento, aislándola de las
+    interacciones del sidebar.
+
     Implementa el patrón Presentation Model para mostrar los argumentos
     del debate de manera estructurada y visualmente atractiva. Utiliza
     diseño responsivo y expandible para manejar contenido variable.
@@ -592,76 +1097,92 @@ def display_live_debate(state: Optional[Dict[str, Any]]) -> None:
     if not pro_arguments and not contra_arguments:
         st.warning("⚠️ No se generaron argumentos en el debate")
         return
-    
+
+    # Short-circuit por hash de contenido - Memoization Pattern
+    # Si los argumentos no cambiaron desde el último render (p. ej. el
+    # rerun vino de un widget del sidebar), se reemite el HTML cacheado
+    # sin reconstruir el transcript completo
+    signature = hash((
+        tuple((a.get('content'), a.get('confidence_score')) for a in pro_arguments),
+        tuple((a.get('content'), a.get('confidence_score')) for a in contra_arguments)
+    ))
+    if (st.session_state.get('_live_sig') == signature
+            and '_live_html' in st.session_state):
+        st.markdown(st.session_state._live_html, unsafe_allow_html=True)
+        return
+
     # Cálculo del número máximo de rondas para iteración
     max_rounds = max(len(pro_arguments), len(contra_arguments))
-    
+
+    # Construcción del transcript completo como un único string HTML.
+    # Un solo st.markdown en lugar de ~5 elementos Streamlit por ronda
+    # reduce el árbol de componentes que Streamlit diffea en cada rerun
+    # de O(rondas) a O(1). El layout a dos columnas es UN único grid CSS
+    # para todo el debate (no un grid por ronda): los headers y
+    # separadores ocupan el ancho completo vía grid-column 1/-1.
+    parts: List[str] = [
+        '<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">'
+    ]
+
     # Iteración por ronda - Template Method Pattern
     for round_num in range(max_rounds):
-        st.markdown(f"### 🔥 Ronda {round_num + 1}")
-        
-        # Layout de dos columnas para debate adversarial
-        col1, col2 = st.columns(2)
-        
+        parts.append(f'<h3 style="grid-column: 1 / -1;">🔥 Ronda {round_num + 1}</h3>')
+
         # Renderizado de argumento PRO - Strategy Pattern
         if round_num < len(pro_arguments):
-            pro_arg = pro_arguments[round_num]
-            with col1:
-                # Extracción de metadatos con valores por defecto
-                confidence = pro_arg.get('confidence_score', 0)
-                strategy = pro_arg.get('strategy', 'unknown')
-                
-                # Renderizado de argumento con diseño branded
-                st.markdown(f"""
-                <div class="pro-argument">
-                    <h4>🟢 Supervisor PRO (Confianza: {confidence:.2f})</h4>
-                    <p><strong>Estrategia:</strong> {strategy.upper()}</p>
-                    <p>{pro_arg.get('content', 'Sin contenido')}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Puntos clave expandibles - Progressive Disclosure
-                if pro_arg.get('key_points'):
-                    with st.expander(f"🔑 Puntos clave PRO - Ronda {round_num + 1}"):
-                        for i, point in enumerate(pro_arg['key_points'], 1):
-                            st.write(f"{i}. {point}")
-        
+            parts.append(_argument_card_html(pro_arguments[round_num], "pro", round_num + 1))
+        else:
+            parts.append("<div></div>")
+
         # Renderizado de argumento CONTRA - Strategy Pattern (variante)
         if round_num < len(contra_arguments):
-            contra_arg = contra_arguments[round_num]
-            with col2:
-                # Extracción de metadatos con valores por defecto
-                confidence = contra_arg.get('confidence_score', 0)
-                strategy = contra_arg.get('strategy', 'unknown')
-                
-                # Renderizado de argumento con diseño alternativo
-                st.markdown(f"""
-                <div class="contra-argument">
-                    <h4>🔴 Supervisor CONTRA (Confianza: {confidence:.2f})</h4>
-                    <p><strong>Estrategia:</strong> {strategy.upper()}</p>
-                    <p>{contra_arg.get('content', 'Sin contenido')}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Puntos clave expandibles - Progressive Disclosure
-                if contra_arg.get('key_points'):
-                    with st.expander(f"🔑 Puntos clave CONTRA - Ronda {round_num + 1}"):
-                        for i, point in enumerate(contra_arg['key_points'], 1):
-                            st.write(f"{i}. {point}")
-        
+            parts.append(_argument_card_html(contra_arguments[round_num], "contra", round_num + 1))
+        else:
+            parts.append("<div></div>")
+
         # Separador visual entre rondas (excepto la última)
         if round_num < max_rounds - 1:
-            st.markdown("---")
+            parts.append('<hr style="grid-column: 1 / -1;">')
 
+    parts.append("</div>")
 
+    # Emisión única - un solo elemento Streamlit para todo el debate,
+    # cacheado en session_state para el short-circuit del próximo rerun
+    transcript_html = "".join(parts)
+    st.session_state._live_html = transcript_html
+    st.session_state._live_sig = signature
+    st.markdown(transcript_html, unsafe_allow_html=True)
+
+
+@st.fragment
+def _render_summary(summary: str) -> None:
+    """
+    Renderiza el resumen ejecutivo en su propio fragment.
+
+    El resumen era un st.text_area deshabilitado, un widget pesado que
+    Streamlit re-diffea completo en cada rerun aunque el texto (miles de
+    caracteres) nunca cambia. Como es de solo lectura, un bloque de
+    código markdown es estrictamente más ligero, y el fragment acota su
+    re-render a interacciones dentro del propio bloque.
+
+    Args:
+        summary (str): Texto del resumen ejecutivo del debate.
+    """
+    st.markdown(f"```\n{summary}\n```")
+
+
+@st.fragment
 def display_results(state: Optional[Dict[str, Any]]) -> None:
     """
     Presenta los resultados finales del debate con análisis completo.
-    
+
     Implementa el patrón Report Generator para crear un resumen comprehensivo
     de los resultados del debate, incluyendo ganador, métricas, evidencia
     y análisis estadístico.
-    
+
+    Decorada con @st.fragment para aislar su re-render de las
+    interacciones del sidebar (ver display_live_debate).
+
     Args:
         state (Optional[Dict[str, Any]]): Estado final del debate
             Estructura esperada:
@@ -718,95 +1239,324 @@ def display_results(state: Optional[Dict[str, Any]]) -> None:
         st.warning(f"❓ **RESULTADO: {winner.upper()}**")
     
     # Dashboard de métricas finales - Dashboard Pattern
-    final_scores = state.get('final_scores', {})
+    # Desestructuración única: cada cadena .get('final_scores', {}).get(...)
+    # costaba dos lookups y un dict vacío fresco por métrica
+    final_scores = state.get('final_scores') or {}
     if final_scores:
+        pro_avg = final_scores.get('pro_average', 0)
+        contra_avg = final_scores.get('contra_average', 0)
+        pro_total_args = final_scores.get('pro_total_arguments', 0)
+        contra_total_args = final_scores.get('contra_total_arguments', 0)
+
         # Layout en cuatro columnas para métricas balanceadas
         col1, col2, col3, col4 = st.columns(4)
-        
+
         # Métrica de puntuación PRO
         with col1:
             st.metric(
-                "🟢 PRO Score", 
-                f"{final_scores.get('pro_average', 0):.3f}",
+                "🟢 PRO Score",
+                f"{pro_avg:.3f}",
                 delta=None  # Sin delta comparativo
             )
-        
+
         # Métrica de puntuación CONTRA
         with col2:
             st.metric(
-                "🔴 CONTRA Score", 
-                f"{final_scores.get('contra_average', 0):.3f}",
+                "🔴 CONTRA Score",
+                f"{contra_avg:.3f}",
                 delta=None
             )
-        
+
         # Métrica de cantidad de argumentos PRO
         with col3:
             st.metric(
-                "📜 Args PRO", 
-                final_scores.get('pro_total_arguments', 0)
+                "📜 Args PRO",
+                pro_total_args
             )
-        
+
         # Métrica de cantidad de argumentos CONTRA
         with col4:
             st.metric(
-                "📜 Args CONTRA", 
-                final_scores.get('contra_total_arguments', 0)
+                "📜 Args CONTRA",
+                contra_total_args
             )
-        
+
         # Análisis de margen de victoria - Business Intelligence
-        pro_avg = final_scores.get('pro_average', 0)
-        contra_avg = final_scores.get('contra_average', 0)
-        margin = abs(pro_avg - contra_avg)
-        
-        # Clasificación de cercanía basada en umbrales empíricos
-        if margin < 0.05:
-            st.info("⚖️ Debate muy reñido")
-        elif margin < 0.15:
-            st.info("🎯 Victoria por margen estrecho")
-        else:
-            st.info("🎯 Victoria clara")
+        # La clase viene precalculada del debate; el fallback cubre
+        # resultados históricos anteriores a ese campo
+        margin_class = state.get('margin_class')
+        if margin_class is None:
+            margin = abs(pro_avg - contra_avg)
+            margin_class = (
+                'tight' if margin < 0.05
+                else 'narrow' if margin < 0.15
+                else 'clear'
+            )
+        st.info(_MARGIN_MESSAGES[margin_class])
     
     # Visualización del resumen ejecutivo - Document Viewer Pattern
     summary = state.get('debate_summary', '')
     if summary:
         st.subheader("📋 Resumen Ejecutivo")
-        st.text_area("", value=summary, height=200, disabled=True)
+        _render_summary(summary)
     
     # Sección de evidencia utilizada - Evidence Browser Pattern
     st.subheader("📊 Evidencia Utilizada")
-    
+
+    # Clave con namespace de sesión: el cache de columnas es global al
+    # proceso y los ids de debate colisionan entre sesiones
+    debate_key = _store_key(st.session_state.get('current_debate_id'))
+
     # Layout dividido para evidencia comparativa
     col1, col2 = st.columns(2)
-    
-    # Evidencia del equipo PRO
+
+    # Evidencia preformateada y cacheada, un único st.markdown por
+    # columna en lugar de dos comandos por fila (menos mensajes al
+    # frontend y menos nodos DOM)
     with col1:
-        st.write("**🟢 Evidencia PRO:**")
-        pro_fragments = state.get('pro_fragments', [])
-        if pro_fragments:
-            # Mostrar las 5 mejores fuentes con truncamiento inteligente
-            for i, frag in enumerate(pro_fragments[:5], 1):
-                st.write(f"{i}. [{frag.get('source', 'N/A')}] {frag.get('title', 'Sin título')[:50]}...")
-                st.caption(f"Score: {frag.get('final_score', 0):.2f}")
-        else:
-            st.write("No se encontró evidencia")
-    
-    # Evidencia del equipo CONTRA
+        st.markdown(
+            _format_fragment_markdown(debate_key, "pro", state.get('pro_fragments', [])),
+            unsafe_allow_html=True
+        )
+
     with col2:
-        st.write("**🔴 Evidencia CONTRA:**")
-        contra_fragments = state.get('contra_fragments', [])
-        if contra_fragments:
-            # Mostrar las 5 mejores fuentes con truncamiento inteligente
-            for i, frag in enumerate(contra_fragments[:5], 1):
-                st.write(f"{i}. [{frag.get('source', 'N/A')}] {frag.get('title', 'Sin título')[:50]}...")
-                st.caption(f"Score: {frag.get('final_score', 0):.2f}")
-        else:
-            st.write("No se encontró evidencia")
+        st.markdown(
+            _format_fragment_markdown(debate_key, "contra", state.get('contra_fragments', [])),
+            unsafe_allow_html=True
+        )
+
+
+def _serialize_config(config: Dict[str, Union[str, int]]) -> bytes:
+    """
+    Serializa la configuración a bytes canónicos (claves ordenadas).
+
+    Se invoca una sola vez por rerun completo; los bytes se guardan en
+    session_state y sirven como clave de cache estable y barata de
+    hashear para los builders de exportación, en lugar de re-serializar
+    el mismo dict pequeño en cada consumidor.
 
+    Args:
+        config (Dict): Configuración del debate.
+
+    Returns:
+        bytes: JSON canónico de la configuración.
+    """
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(config, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+@st.cache_data(show_spinner=False)
+def _build_export_json(debate_key: str, config_bytes: bytes,
+                       _state: Dict[str, Any],
+                       _config: Dict[str, Union[str, int]]) -> Union[bytes, str]:
+    """
+    Construye (y memoiza) el payload JSON de exportación de un debate.
+
+    La clave de cache es (clave sesión:debate, bytes canónicos de
+    config): el estado final es inmutable una vez completado, así que
+    reruns posteriores del tab de exportación devuelven los bytes
+    memoizados en O(1) en lugar de recorrer de nuevo fragmentos y
+    argumentos. Los argumentos con guion bajo quedan fuera del hashing
+    de st.cache_data (los dicts grandes no se hashean). La clave lleva
+    el prefijo de sesión (_store_key): los ids de debate son timestamps
+    de segundo y st.cache_data es global al proceso, así que el id a
+    secas dejaría que una sesión descargara el export de otra.
+
+    Args:
+        debate_key (str): Clave sesión:debate (ver _store_key).
+        config_bytes (bytes): Config preserializada (clave de cache).
+        _state (Dict[str, Any]): Estado final del debate (no hasheado).
+        _config (Dict): Configuración original del debate (no hasheada).
+
+    Returns:
+        Union[bytes, str]: JSON serializado (bytes con orjson, str con
+            el fallback de stdlib).
+    """
+    # Serialización JSON con configuración optimizada: orjson (C/Rust,
+    # ~5x más rápido y con soporte nativo de datetime) cuando está
+    # disponible; st.download_button acepta bytes directamente, así que
+    # no se paga un .decode() que anularía la ganancia
+    if orjson is not None:
+        return orjson.dumps(
+            _export_dto(_state, _config),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(_export_dto(_state, _config), indent=2, ensure_ascii=False)
+
+
+@st.cache_data(show_spinner=False)
+def _format_fragment_markdown(debate_key: str, team: str,
+                              _fragments: List[Dict[str, Any]]) -> str:
+    """
+    Preformatea (y memoiza) la columna de evidencia para display_results.
+
+    El trabajo de slicing, .get encadenados y f-strings de las 5 mejores
+    fuentes se hace una vez por debate/equipo, y el resultado es UN solo
+    bloque markdown: la columna completa se pinta con una única llamada
+    a st.markdown en lugar de dos comandos Streamlit por fila. Clave de
+    cache: (clave sesión:debate, team); la lista de fragmentos va con
+    guion bajo para excluirla del hashing, por lo que la clave DEBE
+    llevar el prefijo de sesión — el id a secas es un timestamp de
+    segundo y este cache es global al proceso.
+
+    Args:
+        debate_key (str): Clave sesión:debate (ver _store_key).
+        team (str): "pro" o "contra" (encabezado y clave de cache).
+        _fragments (List[Dict]): Fragmentos de evidencia (no hasheados).
+
+    Returns:
+        str: Bloque markdown con encabezado y las 5 mejores fuentes.
+    """
+    header = "**🟢 Evidencia PRO:**" if team == "pro" else "**🔴 Evidencia CONTRA:**"
+    lines: List[str] = [header]
+    for i, frag in enumerate(_fragments[:5], 1):
+        # Unpack en batch desde la definición única de campos/defaults
+        source, title, score = (frag.get(key, default)
+                                for key, default in _FRAGMENT_FIELDS)
+        lines.append(
+            f"{i}. [{source}] {title[:50]}...  \n"
+            f"<small>Score: {score:.2f}</small>"
+        )
+    if len(lines) == 1:
+        lines.append("No se encontró evidencia")
+    return "\n\n".join(lines)
+
+
+def _export_dto(state: Dict[str, Any],
+                config: Dict[str, Union[str, int]]) -> Dict[str, Any]:
+    """
+    Construye la estructura de datos de exportación - DTO Pattern.
+
+    Definición única del envelope compartida por los builders compacto y
+    pretty: ambos serializan exactamente el mismo documento y solo
+    difieren en las opciones de dumps.
+
+    Args:
+        state (Dict[str, Any]): Estado final del debate.
+        config (Dict): Configuración original del debate.
+
+    Returns:
+        Dict[str, Any]: DTO anidado listo para serializar.
+    """
+    return {
+        "config": config,  # Configuración original del debate
+        "results": {
+            "winner": state.get('winner'),
+            "final_scores": state.get('final_scores'),
+            "debate_summary": state.get('debate_summary'),
+            "arguments": {
+                "pro": state.get('pro_arguments', []),
+                "contra": state.get('contra_arguments', [])
+            },
+            "evidence": {
+                "pro_fragments": state.get('pro_fragments', []),
+                "contra_fragments": state.get('contra_fragments', [])
+            },
+            "metadata": {
+                "start_time": state.get('start_time'),
+                "current_time": state.get('current_time'),
+                "errors": state.get('errors', [])
+            }
+        }
+    }
 
+
+@st.cache_data(show_spinner=False)
+def _build_compact_json(debate_key: str, config_bytes: bytes,
+                        _state: Dict[str, Any],
+                        _config: Dict[str, Union[str, int]]) -> Union[bytes, str]:
+    """
+    Construye (y memoiza) el export JSON compacto de un debate.
+
+    Mismo DTO, mismas opciones de claves y misma clave de cache
+    sesión:debate que _build_export_json (solo cambia la indentación):
+    un único dumps compacto. El framing manual por trozos que hubo aquí
+    no reducía el pico de memoria — el resultado se memoiza completo de
+    todos modos — y omitía OPT_NON_STR_KEYS, con lo que un estado que
+    exportaba bien en pretty rompía la descarga compacta.
+
+    Args:
+        debate_key (str): Clave sesión:debate (ver _store_key).
+        config_bytes (bytes): Config preserializada (clave de cache).
+        _state (Dict[str, Any]): Estado final del debate (no hasheado).
+        _config (Dict): Configuración original del debate (no hasheada).
+
+    Returns:
+        Union[bytes, str]: Documento JSON compacto completo.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            _export_dto(_state, _config),
+            option=orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(_export_dto(_state, _config),
+                      ensure_ascii=False, separators=(",", ":"))
+
+
+@st.cache_data(show_spinner=False)
+def _render_txt_summary(debate_key: str, config_bytes: bytes,
+                        _state: Dict[str, Any],
+                        _config: Dict[str, Union[str, int]]) -> str:
+    """
+    Genera (y memoiza) el resumen textual de exportación de un debate.
+
+    Misma estrategia de cache que _build_export_json: clave por
+    sesión:debate y config preserializada, dicts grandes excluidos del
+    hashing. Solo se invoca cuando el usuario realmente pide la
+    descarga TXT.
+
+    Args:
+        debate_key (str): Clave sesión:debate (ver _store_key).
+        config_bytes (bytes): Config preserializada (clave de cache).
+        _state (Dict[str, Any]): Estado final del debate (no hasheado).
+        _config (Dict): Configuración original del debate (no hasheada).
+
+    Returns:
+        str: Resumen legible del debate.
+    """
+    # Generación de resumen textual - Template Method
+    # Locales + generadores: sin doble .get del estado ni listas
+    # intermedias antes del join
+    pro_arguments = _state.get('pro_arguments', [])
+    contra_arguments = _state.get('contra_arguments', [])
+    pro_lines = "\n".join(
+        f"Ronda {i}: {arg.get('content', '')}"
+        for i, arg in enumerate(pro_arguments, 1)
+    )
+    contra_lines = "\n".join(
+        f"Ronda {i}: {arg.get('content', '')}"
+        for i, arg in enumerate(contra_arguments, 1)
+    )
+
+    return f"""
+DEBATE: {_config['topic']}
+FECHA: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+POSICIONES:
+PRO: {_config['pro_position']}
+CONTRA: {_config['contra_position']}
+
+GANADOR: {_state.get('winner', 'No determinado')}
+
+ARGUMENTOS PRO:
+{pro_lines}
+
+ARGUMENTOS CONTRA:
+{contra_lines}
+"""
+
+
+@st.fragment
 def export_debate_results(state: Optional[Dict[str, Any]], config: Dict[str, Union[str, int]]) -> None:
     """
     Proporciona funcionalidad de exportación de resultados del debate.
-    
+
+    Decorada con @st.fragment (como las otras dos pestañas de
+    resultados): interactuar con el checkbox de pretty-print o los
+    botones de descarga re-ejecuta solo esta función, no el script
+    completo.
+
     Implementa el patrón Exporter para permitir múltiples formatos de
     exportación de datos del debate. Utiliza serialización JSON y
     formateo de texto para diferentes casos de uso.
@@ -840,71 +1590,60 @@ def export_debate_results(state: Optional[Dict[str, Any]], config: Dict[str, Uni
     # Guard clause para estado inválido - Defensive Programming
     if not state:
         return
-    
+
     st.subheader("📤 Exportar Resultados")
-    
-    # Preparación de estructura de datos para exportación - DTO Pattern
-    export_data: Dict[str, Any] = {
-        "config": config,  # Configuración original del debate
-        "results": {
-            "winner": state.get('winner'),
-            "final_scores": state.get('final_scores'),
-            "debate_summary": state.get('debate_summary'),
-            "arguments": {
-                "pro": state.get('pro_arguments', []),
-                "contra": state.get('contra_arguments', [])
-            },
-            "evidence": {
-                "pro_fragments": state.get('pro_fragments', []),
-                "contra_fragments": state.get('contra_fragments', [])
-            },
-            "metadata": {
-                "start_time": state.get('start_time'),
-                "current_time": state.get('current_time'),
-                "errors": state.get('errors', [])
-            }
-        }
-    }
-    
-    # Serialización JSON con configuración optimizada
-    json_data = json.dumps(export_data, indent=2, ensure_ascii=False)
-    
+
+    debate_id = st.session_state.get('current_debate_id')
+
+    # El id del debate ya es un timestamp %Y%m%d_%H%M%S: reutilizarlo
+    # evita dos datetime.now().strftime por render y garantiza que ambas
+    # descargas compartan el mismo sello temporal
+    file_stamp = debate_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    # Clave de cache con namespace de sesión: los ids son timestamps de
+    # segundo y los caches de st.cache_data son globales al proceso; sin
+    # el prefijo, dos sesiones coincidentes descargarían el export ajeno
+    debate_key = _store_key(debate_id)
+
+    # Config preserializada una vez por rerun en main(); el fallback
+    # cubre llamadas fuera de ese flujo. Los bytes actúan de clave de
+    # cache estable para los builders sin re-hashear el dict
+    config_bytes = st.session_state.get('config_bytes') or _serialize_config(config)
+
     # Layout de botones de descarga en dos columnas
     col1, col2 = st.columns(2)
-    
-    # Exportación JSON - Formato estructurado para análisis
+
+    # Exportación JSON - Formato estructurado para análisis.
+    # data como callable (Deferred Execution): el payload solo se
+    # materializa cuando el usuario pulsa el botón; combinado con los
+    # helpers cacheados, renderizar el tab no serializa nada.
+    # Compacto por defecto (~2x más rápido de serializar y menos bytes);
+    # la indentación es opt-in para quien quiera leer el archivo a mano
     with col1:
+        pretty_json = st.checkbox(
+            "Indentar JSON (pretty-print)",
+            value=False,
+            help="La salida compacta es más rápida y pequeña; actívalo solo para lectura manual"
+        )
+
+        if pretty_json:
+            json_builder = lambda: _build_export_json(debate_key, config_bytes, state, config)
+        else:
+            json_builder = lambda: _build_compact_json(debate_key, config_bytes, state, config)
+
         st.download_button(
             label="📥 Descargar como JSON",
-            data=json_data,
-            file_name=f"debate_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            data=json_builder,
+            file_name=f"debate_{file_stamp}.json",
             mime="application/json"
         )
-    
-    # Exportación TXT - Formato legible para documentación
-    with col2:
-        # Generación de resumen textual - Template Method
-        text_summary = f"""
-DEBATE: {config['topic']}
-FECHA: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
-POSICIONES:
-PRO: {config['pro_position']}
-CONTRA: {config['contra_position']}
-
-GANADOR: {state.get('winner', 'No determinado')}
-
-ARGUMENTOS PRO:
-{chr(10).join([f"Ronda {i+1}: {arg.get('content', '')}" for i, arg in enumerate(state.get('pro_arguments', []))])}
-
-ARGUMENTOS CONTRA:
-{chr(10).join([f"Ronda {i+1}: {arg.get('content', '')}" for i, arg in enumerate(state.get('contra_arguments', []))])}
-"""
-        
+    # Exportación TXT - Formato legible para documentación (también diferido)
+    with col2:
         st.download_button(
             label="📄 Descargar como TXT",
-            data=text_summary,
-            file_name=f"debate_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+            data=lambda: _render_txt_summary(debate_key, config_bytes, state, config),
+            file_name=f"debate_{file_stamp}.txt",
             mime="text/plain"
         )
 
@@ -966,7 +1705,12 @@ def main() -> None:
     
     # Configuración del debate mediante sidebar - Configuration Pattern
     config = sidebar_configuration()
-    
+
+    # Serialización única de la config por rerun - One-shot Serialization
+    # Los bytes canónicos sirven de clave de cache para los builders de
+    # exportación sin re-serializar el dict en cada consumidor
+    st.session_state.config_bytes = _serialize_config(config)
+
     # Validación de configuración con feedback inmediato - Fail-Fast
     config_errors = validate_debate_config(config)
     
@@ -977,40 +1721,62 @@ def main() -> None:
             st.write(f"• {error}")
         st.stop()  # Detener ejecución hasta corrección
     
+    # Ejecución condicional del debate - State-driven Execution
+    # Cortocircuito: mientras el debate corre, la página se reduce a un
+    # único placeholder con el progreso. Preview, botón e historial no
+    # son interactivos durante el spinner, así que ni se montan
+    if st.session_state.debate_running:
+        placeholder = st.empty()
+        with placeholder.container():
+            # Contenedor de ejecución con spinner para UX
+            with st.spinner("🎭 Equipos de IA debatiendo..."):
+                result = run_debate_with_progress(config)
+
+                # Procesamiento de resultados exitosos
+                if result:
+                    # Persistencia en estado de sesión - Session Management
+                    # El cuerpo del resultado va al store de proceso; en el
+                    # historial solo queda la referencia ligera por id
+                    st.session_state.debate_result = result
+                    history = st.session_state.debate_history
+                    store = get_result_store()
+
+                    # La deque va a desalojar su entrada más antigua:
+                    # retirar también el cuerpo del store para no dejar
+                    # resultados huérfanos acumulándose en el proceso
+                    if len(history) == history.maxlen:
+                        store.pop(_store_key(history[0].id), None)
+
+                    _store_result(_store_key(st.session_state.current_debate_id), result)
+                    history.append(StoredDebate(
+                        id=st.session_state.current_debate_id,
+                        config=config,
+                        timestamp=datetime.now()
+                    ))
+
+                # Transición de estado post-ejecución
+                st.session_state.debate_running = False
+
+        # Rerun limpio para montar la página completa con los resultados
+        st.rerun()
+
     # Vista previa del debate configurado - Preview Pattern
     st.subheader("👀 Vista Previa del Debate")
     create_debate_preview(config)
-    
+
     # Botón de inicio de debate con layout centrado - Call-to-Action Pattern
     col1, col2, col3 = st.columns([1, 2, 1])
-    
+
     with col2:
         # Botón principal con estilo prominente
         if st.button("🚀 INICIAR DEBATE", type="primary", use_container_width=True):
             # Activación de estado de ejecución - State Transition
             st.session_state.debate_running = True
             st.session_state.current_debate_id = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
-    # Ejecución condicional del debate - State-driven Execution
-    if st.session_state.debate_running:
-        # Contenedor de ejecución con spinner para UX
-        with st.spinner("🎭 Equipos de IA debatiendo..."):
-            result = run_debate_with_progress(config)
-            
-            # Procesamiento de resultados exitosos
-            if result:
-                # Persistencia en estado de sesión - Session Management
-                st.session_state.debate_result = result
-                st.session_state.debate_history.append({
-                    "id": st.session_state.current_debate_id,
-                    "config": config,
-                    "result": result,
-                    "timestamp": datetime.now()
-                })
-            
-            # Transición de estado post-ejecución
-            st.session_state.debate_running = False
-    
+            # Rerun inmediato: el próximo pase entra directo en la rama
+            # de ejecución sin renderizar el resto de la página
+            st.rerun()
+
     # Visualización de resultados si están disponibles - Conditional Rendering
     if st.session_state.debate_result:
         st.markdown("---")  # Separador visual
@@ -1035,12 +1801,29 @@ def main() -> None:
         st.sidebar.markdown("---")
         st.sidebar.subheader("📚 Historial de Debates")
         
-        # Mostrar últimos 5 debates con navegación
-        for debate in st.session_state.debate_history[-5:]:  # Últimos 5
-            # Botón de navegación para cada debate histórico
-            if st.sidebar.button(f"📄 {debate['config']['topic'][:30]}...", key=debate['id']):
-                # Carga de debate histórico - State Loading
-                st.session_state.debate_result = debate['result']
+        # Últimos 5 debates en un único selectbox (más reciente primero;
+        # islice sobre reversed evita copiar la deque en cada rerun):
+        # un solo widget por rerun en lugar de un botón por entrada
+        labels = {
+            debate.id: f"📄 {debate.config['topic'][:30]}..."
+            for debate in islice(reversed(st.session_state.debate_history), 5)
+        }
+        selected = st.sidebar.selectbox(
+            "Debates recientes",
+            list(labels),
+            index=None,
+            placeholder="Selecciona un debate...",
+            format_func=labels.get
+        )
+        if selected and selected != st.session_state.current_debate_id:
+            # Carga de debate histórico - State Loading
+            # Rehidratación desde el store de proceso; el id también
+            # se restaura porque es la clave de los caches por
+            # debate de export y evidencia
+            stored_result = _load_result(_store_key(selected))
+            if stored_result:
+                st.session_state.debate_result = stored_result
+                st.session_state.current_debate_id = selected
                 st.rerun()  # Recarga de interfaz con nuevo estado
 
 